@@ -2,4 +2,7 @@
 from .map import SurveillanceMap
 from .loiter import Loiter, LoiterType
 from .geometry import Point, calculate_distance, normalize_angle
-from .dubins import DubinsPath, generate_dubins_path
+from .dubins import (
+    DubinsContext, DubinsPath, generate_dubins_path, generate_dubins_paths,
+    make_dubins_context
+)
@@ -8,7 +8,7 @@ Perfect for our Swift-inspired drone!
 """
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 from enum import Enum, auto
 import numpy as np
@@ -50,6 +50,7 @@ class DubinsPath:
     
     # Precomputed waypoints
     _waypoints: List[Point] = None
+    _xy: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
     
     @property
     def total_length(self) -> float:
@@ -63,6 +64,14 @@ class DubinsPath:
             self._generate_waypoints()
         return self._waypoints
     
+    @property
+    def xy(self) -> np.ndarray:
+        """Waypoints as an (M, 2) array of x, y"""
+        if self._xy is None:
+            pts = self.waypoints
+            self._xy = np.array([(p.x, p.y) for p in pts], dtype=float).reshape(len(pts), 2)
+        return self._xy
+    
     def _generate_waypoints(self, step_size: float = 5.0) -> None:
         """Generate waypoints along the path"""
         self._waypoints = []
@@ -172,12 +181,25 @@ class DubinsPath:
         return waypoints, end_point, end_heading
 
 
+@dataclass(frozen=True)
+class DubinsContext:
+    """Turn-radius invariants shared by every path solved at that radius"""
+    turn_radius: float
+    inv_r: float        # 1 / turn_radius, scales distances to unit radius
+
+
+def make_dubins_context(turn_radius: float) -> DubinsContext:
+    """Precompute the invariants for a turn radius"""
+    return DubinsContext(turn_radius=turn_radius, inv_r=1.0 / turn_radius)
+
+
 def generate_dubins_path(
     start: Point,
     start_heading: float,
     end: Point,
     end_heading: float,
-    turn_radius: float
+    turn_radius: float,
+    ctx: Optional[DubinsContext] = None
 ) -> Optional[DubinsPath]:
     """
     Generate the shortest Dubins path between two configurations
@@ -188,6 +210,7 @@ def generate_dubins_path(
         end: Ending position
         end_heading: Ending heading in radians
         turn_radius: Minimum turn radius
+        ctx: Prebuilt context for turn_radius (saves recomputing it per call)
     
     Returns:
         DubinsPath object representing the shortest path, or None if no path exists
@@ -195,7 +218,7 @@ def generate_dubins_path(
     # Normalize to unit turn radius for calculations
     dx = end.x - start.x
     dy = end.y - start.y
-    d = math.sqrt(dx*dx + dy*dy) / turn_radius
+    d = math.sqrt(dx*dx + dy*dy) * (ctx.inv_r if ctx is not None else 1.0 / turn_radius)
     
     # Angle from start to end
     theta = math.atan2(dy, dx)
@@ -229,6 +252,140 @@ def generate_dubins_path(
     return best_path
 
 
+def generate_dubins_paths(
+    start: Point,
+    start_heading: float,
+    ends: List[Point],
+    end_headings: List[float],
+    turn_radius: float,
+    ctx: Optional[DubinsContext] = None
+) -> List[Optional[DubinsPath]]:
+    """
+    Shortest Dubins path from one start to each of several end configurations
+    
+    Vectorized over the candidates: all six path types are solved for every
+    end at once. Equivalent to calling generate_dubins_path per end.
+    """
+    n = len(ends)
+    if n == 0:
+        return []
+    
+    end_x = np.array([p.x for p in ends], dtype=float)
+    end_y = np.array([p.y for p in ends], dtype=float)
+    end_headings = np.asarray(end_headings, dtype=float)
+    
+    dx = end_x - start.x
+    dy = end_y - start.y
+    d = np.hypot(dx, dy) * (ctx.inv_r if ctx is not None else 1.0 / turn_radius)
+    theta = np.arctan2(dy, dx)
+    alpha = _normalize_angles(start_heading - theta)
+    beta = _normalize_angles(end_headings - theta)
+    
+    # (6, n) segment lengths in DubinsPathType order, NaN where infeasible
+    t, p, q = _compute_dubins_segments_batch(d, alpha, beta)
+    lengths = t + p + q
+    feasible = ~np.isnan(lengths).all(axis=0)
+    best = np.argmin(np.where(np.isnan(lengths), np.inf, lengths), axis=0)
+    
+    types = list(DubinsPathType)
+    paths = []
+    for i in range(n):
+        if not feasible[i]:
+            paths.append(None)
+            continue
+        k = best[i]
+        paths.append(DubinsPath(
+            start=start,
+            end=ends[i],
+            start_heading=start_heading,
+            end_heading=float(end_headings[i]),
+            turn_radius=turn_radius,
+            path_type=types[k],
+            segment1_length=float(t[k, i]) * turn_radius,
+            segment2_length=float(p[k, i]) * turn_radius,
+            segment3_length=float(q[k, i]) * turn_radius
+        ))
+    return paths
+
+
+def _normalize_angles(angle: np.ndarray) -> np.ndarray:
+    """Vectorized normalize_angle into [-pi, pi]"""
+    return angle - 2 * math.pi * np.ceil((angle - math.pi) / (2 * math.pi))
+
+
+def _compute_dubins_segments_batch(
+    d: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    _compute_dubins_segments for every path type over arrays of (d, alpha, beta)
+    
+    Returns (t, p, q), each shaped (6, n) in DubinsPathType order, with NaN
+    marking infeasible path types.
+    """
+    sa = np.sin(alpha)
+    sb = np.sin(beta)
+    ca = np.cos(alpha)
+    cb = np.cos(beta)
+    cab = np.cos(alpha - beta)
+    dd = d * d
+    
+    def sqrt_or_nan(tmp):
+        return np.sqrt(np.where(tmp < 0, np.nan, tmp))
+    
+    def acos_or_nan(tmp):
+        return np.arccos(np.where(np.abs(tmp) > 1, np.nan, tmp))
+    
+    # LSL
+    p_lsl = sqrt_or_nan(2 + dd - 2*cab + 2*d*(sa - sb))
+    th = np.arctan2(cb - ca, d + sa - sb)
+    t_lsl = _normalize_angles(-alpha + th)
+    q_lsl = _normalize_angles(beta - th)
+    
+    # LSR
+    p_lsr = sqrt_or_nan(-2 + dd + 2*cab + 2*d*(sa + sb))
+    th = np.arctan2(-ca - cb, d + sa + sb) - np.arctan2(-2, p_lsr)
+    t_lsr = _normalize_angles(-alpha + th)
+    q_lsr = _normalize_angles(-beta + th)
+    
+    # RSL
+    p_rsl = sqrt_or_nan(-2 + dd + 2*cab - 2*d*(sa + sb))
+    th = np.arctan2(ca + cb, d - sa - sb) - np.arctan2(2, p_rsl)
+    t_rsl = _normalize_angles(alpha - th)
+    q_rsl = _normalize_angles(beta - th)
+    
+    # RSR
+    p_rsr = sqrt_or_nan(2 + dd - 2*cab + 2*d*(sb - sa))
+    th = np.arctan2(ca - cb, d - sa + sb)
+    t_rsr = _normalize_angles(alpha - th)
+    q_rsr = _normalize_angles(-beta + th)
+    
+    # RLR
+    p_rlr = 2*math.pi - acos_or_nan((6 - dd + 2*cab + 2*d*(sa - sb)) / 8)
+    th = np.arctan2(ca - cb, d - sa + sb)
+    t_rlr = _normalize_angles(alpha - th + p_rlr/2)
+    q_rlr = _normalize_angles(alpha - beta - t_rlr + p_rlr)
+    
+    # LRL
+    p_lrl = 2*math.pi - acos_or_nan((6 - dd + 2*cab + 2*d*(sb - sa)) / 8)
+    th = np.arctan2(ca - cb, d + sa - sb)
+    t_lrl = _normalize_angles(-alpha + th + p_lrl/2)
+    q_lrl = _normalize_angles(beta - alpha - t_lrl + p_lrl)
+    
+    t = np.stack([t_lsl, t_lsr, t_rsl, t_rsr, t_rlr, t_lrl])
+    p = np.stack([p_lsl, p_lsr, p_rsl, p_rsr, p_rlr, p_lrl])
+    q = np.stack([q_lsl, q_lsr, q_rsl, q_rsr, q_rlr, q_lrl])
+    
+    # Infeasible types carry NaN through t and q as well
+    invalid = np.isnan(p)
+    t = np.where(t < 0, t + 2*math.pi, t)
+    q = np.where(q < 0, q + 2*math.pi, q)
+    t[invalid] = np.nan
+    q[invalid] = np.nan
+    return t, p, q
+
+
 def _compute_dubins_segments(
     d: float, 
     alpha: float, 
@@ -9,6 +9,9 @@ from typing import Tuple, List
 import numpy as np
 
 
+TWO_PI = 2 * math.pi
+
+
 @dataclass
 class Point:
     """2D point with x, y coordinates"""
@@ -52,11 +55,7 @@ def calculate_distance(p1: Point, p2: Point) -> float:
 
 def normalize_angle(angle: float) -> float:
     """Normalize angle to [-pi, pi] range"""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    return math.remainder(angle, TWO_PI)
 
 
 def point_in_circle(point: Point, center: Point, radius: float) -> bool:
@@ -68,6 +68,9 @@ class SurveillanceMap:
     obstacle_margin: float = 20.0   # Safety buffer around obstacles (meters)
     no_fly_margin: float = 50.0     # Safety buffer around no-fly zones (meters)
     
+    # Bumped whenever the obstacle grid changes (used to key derived caches)
+    version: int = field(default=0, init=False)
+    
     def __post_init__(self):
         """Initialize the grid"""
         self.grid_width = int(np.ceil(self.width / self.resolution))
@@ -122,6 +125,8 @@ class SurveillanceMap:
         min_y = max(0, int((obstacle.center.y - total_radius) / self.resolution))
         max_y = min(self.grid_height, int((obstacle.center.y + total_radius) / self.resolution) + 1)
         
+        self.version += 1
+        
         # Mark cells within the obstacle
         for cy in range(min_y, max_y):
             for cx in range(min_x, max_x):
@@ -150,18 +155,44 @@ class SurveillanceMap:
     
     def is_point_safe(self, point: Point, check_soft: bool = False) -> bool:
         """Check if a point is safe to fly through"""
-        cell = self.point_to_cell(point)
-        if not self._is_valid_cell(cell):
+        # point_to_cell and _is_valid_cell inlined; is_path_safe calls this per sample
+        cx = int(point.x / self.resolution)
+        cy = int(point.y / self.resolution)
+        if not (0 <= cx < self.grid_width and 0 <= cy < self.grid_height):
             return False
         
-        cell_type = self.grid[cell[1], cell[0]]
+        # item() gives a plain int, which compares far faster than np.int8
+        cell_type = self.grid.item(cy, cx)
         
-        if cell_type in (CellType.OBSTACLE, CellType.NO_FLY):
+        if cell_type == CellType.OBSTACLE or cell_type == CellType.NO_FLY:
             return False
         if check_soft and cell_type == CellType.SOFT_NO_FLY:
             return False
         return True
     
+    def are_points_safe(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        check_soft: bool = False
+    ) -> np.ndarray:
+        """Vectorized is_point_safe over arrays of world coordinates"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        
+        # Truncate toward zero like point_to_cell
+        cx = (xs / self.resolution).astype(np.intp)
+        cy = (ys / self.resolution).astype(np.intp)
+        valid = (cx >= 0) & (cx < self.grid_width) & (cy >= 0) & (cy < self.grid_height)
+        
+        # Index the flattened grid: one linear take instead of 2-D fancy indexing
+        flat_idx = np.where(valid, cy * self.grid_width + cx, 0)
+        cell_type = self.grid.ravel()[flat_idx]
+        unsafe = (cell_type == CellType.OBSTACLE) | (cell_type == CellType.NO_FLY)
+        if check_soft:
+            unsafe |= cell_type == CellType.SOFT_NO_FLY
+        return valid & ~unsafe
+    
     def is_path_safe(
         self, 
         start: Point, 
@@ -105,8 +105,8 @@ class CoveragePlanner:
         current_pos = start_position
         current_heading = 0.0  # Initial heading (east)
         
-        # Track covered cells
-        covered_cells: Set[Tuple[int, int]] = set()
+        # Newly covered cells are distinct across loiters, so a count suffices
+        n_covered = 0
         
         # Get all uncovered cells
         uncovered = set(self.surveillance_map.get_uncovered_cells())
@@ -140,14 +140,14 @@ class CoveragePlanner:
             
             # Update coverage
             newly_covered = self._mark_loiter_coverage(best_loiter, uncovered)
-            covered_cells.update(newly_covered)
+            n_covered += len(newly_covered)
             
             # Update current position and heading
             current_pos = best_loiter.get_exit_point()
             current_heading = best_loiter.exit_heading
             
             # Check if we've reached target coverage
-            coverage_pct = 100.0 * len(covered_cells) / total_free_cells
+            coverage_pct = 100.0 * n_covered / total_free_cells
             if coverage_pct >= self.coverage_threshold:
                 break
         
@@ -169,10 +169,11 @@ class CoveragePlanner:
         
         # Generate candidate positions (grid of potential loiter centers)
         candidates = self._generate_candidates(uncovered)
+        valid = self._valid_loiter_positions(candidates)
         
-        for center in candidates:
+        for center, ok in zip(candidates, valid):
             # Skip if too close to obstacles
-            if not self._is_valid_loiter_position(center):
+            if not ok:
                 continue
             
             # Create candidate loiter
@@ -246,24 +247,30 @@ class CoveragePlanner:
     
     def _is_valid_loiter_position(self, center: Point) -> bool:
         """Check if a loiter can be placed at this position"""
+        return bool(self._valid_loiter_positions([center])[0])
+    
+    def _valid_loiter_positions(self, centers: List[Point]) -> np.ndarray:
+        """Vectorized _is_valid_loiter_position over candidate centers"""
+        smap = self.surveillance_map
+        xs = np.array([c.x for c in centers], dtype=float)
+        ys = np.array([c.y for c in centers], dtype=float)
+        
         # Check if center is in bounds
-        if center.x < 0 or center.x > self.surveillance_map.width:
-            return False
-        if center.y < 0 or center.y > self.surveillance_map.height:
-            return False
+        valid = (xs >= 0) & (xs <= smap.width) & (ys >= 0) & (ys <= smap.height)
         
-        # Check if loiter would intersect obstacles
-        for obstacle in self.surveillance_map.obstacles:
-            min_distance = obstacle.radius + self.loiter_radius
-            if obstacle.is_no_fly:
-                min_distance += self.surveillance_map.no_fly_margin
-            else:
-                min_distance += self.surveillance_map.obstacle_margin
-            
-            if center.distance_to(obstacle.center) < min_distance:
-                return False
+        # Check if loiter would intersect obstacles (candidates x obstacles)
+        if smap.obstacles and len(centers):
+            ox = np.array([o.center.x for o in smap.obstacles])
+            oy = np.array([o.center.y for o in smap.obstacles])
+            min_distance = np.array([
+                o.radius + self.loiter_radius
+                + (smap.no_fly_margin if o.is_no_fly else smap.obstacle_margin)
+                for o in smap.obstacles
+            ])
+            dist = np.sqrt((xs[:, None] - ox) ** 2 + (ys[:, None] - oy) ** 2)
+            valid &= ~(dist < min_distance).any(axis=1)
         
-        return True
+        return valid
     
     def _estimate_coverage(
         self, 
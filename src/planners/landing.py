@@ -16,6 +16,7 @@ Validated across 12 terrain slope profiles in 3D simulation.
 import math
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
+import numpy as np
 
 from ..core.geometry import Point
 from ..core.atmosphere import compute_performance, GRAVITY
@@ -78,6 +79,12 @@ class DescentPlan:
         }
 
 
+def _unit_circle(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """cos/sin of n equally spaced angles around the circle."""
+    angles = np.arange(n) * ((2 * math.pi) / n)
+    return np.cos(angles), np.sin(angles)
+
+
 def compute_descent_plan(
     center: Point,
     radius_m: float,
@@ -118,41 +125,49 @@ def compute_descent_plan(
         terrain_elevation_m=terrain_altitude_m,
     )
 
-    current_alt = start_altitude_m
-    loop = 0
     total_dist = 0.0
     total_time = 0.0
-    angle_step = (2 * math.pi) / waypoints_per_loop
 
     # Phase 1: Spiral descent
+    # Altitude at the start of each loop (safety limit: 51 loops)
+    loop_alts = []
+    current_alt = start_altitude_m
     while current_alt > APPROACH_ALTITUDE_M:
-        loop += 1
-        for i in range(waypoints_per_loop):
-            angle = i * angle_step
-            wx = center.x + radius_m * math.cos(angle)
-            wy = center.y + radius_m * math.sin(angle)
-
-            # Linear altitude decrease across the loop
-            frac = i / waypoints_per_loop
-            alt = current_alt - descent_rate * frac
-
-            plan.waypoints.append(DescentWaypoint(
-                x=wx, y=wy,
-                altitude_m=max(alt, APPROACH_ALTITUDE_M),
+        loop_alts.append(current_alt)
+        current_alt -= descent_rate
+        if len(loop_alts) > 50:
+            break
+    loop = len(loop_alts)
+
+    if loop:
+        # The ring is identical every loop - compute once and tile
+        cos_a, sin_a = _unit_circle(waypoints_per_loop)
+        xs = np.tile(center.x + radius_m * cos_a, loop)
+        ys = np.tile(center.y + radius_m * sin_a, loop)
+
+        # Linear altitude decrease across each loop
+        fracs = np.arange(waypoints_per_loop) / waypoints_per_loop
+        alts = np.maximum(
+            np.asarray(loop_alts)[:, None] - descent_rate * fracs[None, :],
+            APPROACH_ALTITUDE_M,
+        ).ravel()
+        loop_numbers = np.repeat(np.arange(1, loop + 1), waypoints_per_loop)
+
+        plan.waypoints.extend(
+            DescentWaypoint(
+                x=float(wx), y=float(wy),
+                altitude_m=float(alt),
                 speed_ms=approach_speed,
                 bank_deg=BANK_ANGLE_DEG,
                 phase='spiral',
-                loop_number=loop,
-            ))
+                loop_number=int(n),
+            )
+            for wx, wy, alt, n in zip(xs, ys, alts, loop_numbers)
+        )
 
         seg_dist = 2 * math.pi * radius_m
-        seg_time = seg_dist / approach_speed
-        total_dist += seg_dist
-        total_time += seg_time
-        current_alt -= descent_rate
-
-        if loop > 50:  # Safety limit
-            break
+        total_dist += loop * seg_dist
+        total_time += loop * seg_dist / approach_speed
 
     # Phase 2: Transition to straight approach (15m → 3m AGL)
     approach_heading = math.atan2(
@@ -160,23 +175,34 @@ def compute_descent_plan(
         plan.waypoints[-1].x - center.x,
     ) if plan.waypoints else 0
 
+    # Heading is fixed for both straight phases, so trig is loop-invariant
+    cos_h = math.cos(approach_heading)
+    sin_h = math.sin(approach_heading)
+
     approach_distance = radius_m * 0.8  # Approach within the circle
     approach_steps = 12
-    for i in range(approach_steps):
-        frac = i / approach_steps
-        dist = approach_distance * frac
-        wx = plan.waypoints[-1].x + dist * math.cos(approach_heading) if plan.waypoints else center.x
-        wy = plan.waypoints[-1].y + dist * math.sin(approach_heading) if plan.waypoints else center.y
-        alt = APPROACH_ALTITUDE_M - (APPROACH_ALTITUDE_M - FLARE_ALTITUDE_M) * frac
-
-        plan.waypoints.append(DescentWaypoint(
-            x=wx, y=wy,
-            altitude_m=alt,
-            speed_ms=approach_speed * (1 - 0.15 * frac),  # Gradually slow
+    last_wp = plan.waypoints[-1] if plan.waypoints else None
+    base_x = last_wp.x if last_wp else center.x
+    base_y = last_wp.y if last_wp else center.y
+
+    fracs = np.arange(approach_steps) / approach_steps
+    dists = approach_distance * fracs
+    xs = base_x + dists * cos_h
+    ys = base_y + dists * sin_h
+    alts = APPROACH_ALTITUDE_M - (APPROACH_ALTITUDE_M - FLARE_ALTITUDE_M) * fracs
+    speeds = approach_speed * (1 - 0.15 * fracs)  # Gradually slow
+
+    plan.waypoints.extend(
+        DescentWaypoint(
+            x=float(wx), y=float(wy),
+            altitude_m=float(alt),
+            speed_ms=float(spd),
             bank_deg=0,  # Wings level
             phase='approach',
             loop_number=loop,
-        ))
+        )
+        for wx, wy, alt, spd in zip(xs, ys, alts, speeds)
+    )
 
     total_dist += approach_distance
     total_time += approach_distance / (approach_speed * 0.85)
@@ -185,21 +211,24 @@ def compute_descent_plan(
     flare_distance = radius_m * 0.3
     flare_steps = 6
     last_wp = plan.waypoints[-1]
-    for i in range(flare_steps):
-        frac = i / flare_steps
-        dist = flare_distance * frac
-        wx = last_wp.x + dist * math.cos(approach_heading)
-        wy = last_wp.y + dist * math.sin(approach_heading)
-        alt = FLARE_ALTITUDE_M * (1 - frac)
-
-        plan.waypoints.append(DescentWaypoint(
-            x=wx, y=wy,
-            altitude_m=max(alt, 0),
+
+    fracs = np.arange(flare_steps) / flare_steps
+    dists = flare_distance * fracs
+    xs = last_wp.x + dists * cos_h
+    ys = last_wp.y + dists * sin_h
+    alts = np.maximum(FLARE_ALTITUDE_M * (1 - fracs), 0)
+
+    plan.waypoints.extend(
+        DescentWaypoint(
+            x=float(wx), y=float(wy),
+            altitude_m=float(alt),
             speed_ms=approach_speed * 0.75,  # Flare speed
             bank_deg=0,
             phase='flare',
             loop_number=loop,
-        ))
+        )
+        for wx, wy, alt in zip(xs, ys, alts)
+    )
 
     total_dist += flare_distance
     total_time += flare_distance / (approach_speed * 0.6)
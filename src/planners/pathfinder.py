@@ -4,36 +4,154 @@ Properly avoids obstacles with safety margins!
 """
 
 import math
-import heapq
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Set, Dict
+import struct
+from collections import OrderedDict
+from typing import List, Tuple, Optional
 import numpy as np
 
+try:
+    from scipy.ndimage import binary_dilation, distance_transform_edt
+except ImportError:  # SciPy is optional - fall back to Numba / NumPy / BFS
+    binary_dilation = None
+    distance_transform_edt = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional
+    njit = None
+
 from ..core.geometry import Point
 from ..core.map import SurveillanceMap, CellType
 
 
-@dataclass
-class PathNode:
-    """Node for A* pathfinding"""
-    x: int
-    y: int
-    g_cost: float = 0.0
-    h_cost: float = 0.0
-    parent: Optional['PathNode'] = None
+_CELL_BITS = 32
+_CELL_MASK = (1 << _CELL_BITS) - 1
+_FLOAT64 = struct.Struct('<d')
+
+# _line_clear walks the first samples of a segment with a scalar loop (NumPy
+# call overhead dominates on short segments and near hits), then scans the
+# rest in vectorized chunks that start at _LINE_CHUNK_SIZE and double
+_LINE_SCALAR_MAX = 32
+_LINE_CHUNK_SIZE = 64
+
+
+def _pack_key(f_cost: float, cell_id: int) -> int:
+    """Pack (f_cost, cell_id) into one int that sorts like the tuple.
+
+    IEEE-754 bit patterns of non-negative doubles order the same as the
+    values, so heap comparisons become plain int compares.
+    """
+    return (int.from_bytes(_FLOAT64.pack(f_cost), 'little') << _CELL_BITS) | cell_id
+
+
+class _IndexedHeap:
+    """Binary min-heap over integer cell ids with decrease-key"""
+    
+    def __init__(self, size: int):
+        self._heap: List[int] = []              # packed (f_cost, cell_id) keys
+        self._pos: List[int] = [-1] * size     # -1 = not in heap
     
-    @property
-    def f_cost(self) -> float:
-        return self.g_cost + self.h_cost
+    def __len__(self) -> int:
+        return len(self._heap)
     
-    def __lt__(self, other):
-        return self.f_cost < other.f_cost
+    def __contains__(self, item: int) -> bool:
+        return self._pos[item] >= 0
     
-    def __hash__(self):
-        return hash((self.x, self.y))
+    def push(self, item: int, key: float) -> None:
+        self._heap.append(_pack_key(key, item))
+        self._sift_up(len(self._heap) - 1)
     
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
+    def pop(self) -> int:
+        heap = self._heap
+        top = heap[0] & _CELL_MASK
+        last = heap.pop()
+        self._pos[top] = -1
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return top
+    
+    def clear(self) -> None:
+        """Empty the heap, resetting only the positions still in use"""
+        pos = self._pos
+        for entry in self._heap:
+            pos[entry & _CELL_MASK] = -1
+        self._heap.clear()
+    
+    def decrease_key(self, item: int, key: float) -> None:
+        i = self._pos[item]
+        self._heap[i] = _pack_key(key, item)
+        self._sift_up(i)
+    
+    def _sift_up(self, i: int) -> None:
+        heap, pos = self._heap, self._pos
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            p_entry = heap[parent]
+            if p_entry <= entry:
+                break
+            heap[i] = p_entry
+            pos[p_entry & _CELL_MASK] = i
+            i = parent
+        heap[i] = entry
+        pos[entry & _CELL_MASK] = i
+    
+    def _sift_down(self, i: int) -> None:
+        heap, pos = self._heap, self._pos
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            c_entry = heap[child]
+            if c_entry >= entry:
+                break
+            heap[i] = c_entry
+            pos[c_entry & _CELL_MASK] = i
+            i = child
+        heap[i] = entry
+        pos[entry & _CELL_MASK] = i
+
+
+def _dilate_numpy(mask: np.ndarray, k: int) -> np.ndarray:
+    """Square dilation by k cells via separable shifted ORs"""
+    h, w = mask.shape
+    rows = mask.copy()
+    for d in range(1, min(k, w - 1) + 1):
+        rows[:, d:] |= mask[:, :w - d]
+        rows[:, :w - d] |= mask[:, d:]
+    out = rows.copy()
+    for d in range(1, min(k, h - 1) + 1):
+        out[d:, :] |= rows[:h - d, :]
+        out[:h - d, :] |= rows[d:, :]
+    return out
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _dilate_numba(mask, k):
+        """Square dilation by k cells, rows processed in parallel"""
+        h, w = mask.shape
+        rows = np.zeros_like(mask)
+        for y in prange(h):
+            for x in range(w):
+                for xx in range(max(0, x - k), min(w, x + k + 1)):
+                    if mask[y, xx]:
+                        rows[y, x] = True
+                        break
+        out = np.zeros_like(mask)
+        for y in prange(h):
+            for yy in range(max(0, y - k), min(h, y + k + 1)):
+                for x in range(w):
+                    if rows[yy, x]:
+                        out[y, x] = True
+        return out
+else:
+    _dilate_numba = None
 
 
 class AStarPathfinder:
@@ -43,24 +161,37 @@ class AStarPathfinder:
         self.map = surveillance_map
         self.safety_cells = safety_cells  # Cells of margin around obstacles
         self.blocked = self._create_blocked_grid()
+        self._nearest_free_x, self._nearest_free_y = self._build_nearest_free_index()
+        
+        # A* scratch state, reused across queries (so one pathfinder must not
+        # search from two threads at once); _astar restores the defaults for
+        # the cells it touched before returning
+        n_cells = self.map.grid_width * self.map.grid_height
+        self._g_cost = [math.inf] * n_cells
+        self._parent = [-1] * n_cells
+        self._closed = bytearray(n_cells)
+        self._open_set = _IndexedHeap(n_cells)
     
     def _create_blocked_grid(self) -> np.ndarray:
         """Create grid with obstacles expanded by safety margin"""
         grid = self.map.to_numpy()
-        blocked = np.zeros((self.map.grid_height, self.map.grid_width), dtype=bool)
+        mask = np.isin(grid, (CellType.OBSTACLE, CellType.NO_FLY, CellType.SOFT_NO_FLY))
+        k = self.safety_cells
         
-        # Mark obstacles and no-fly zones
-        for cy in range(self.map.grid_height):
-            for cx in range(self.map.grid_width):
-                if grid[cy, cx] in (CellType.OBSTACLE, CellType.NO_FLY, CellType.SOFT_NO_FLY):
-                    # Expand this cell by safety margin
-                    for dy in range(-self.safety_cells, self.safety_cells + 1):
-                        for dx in range(-self.safety_cells, self.safety_cells + 1):
-                            ny, nx = cy + dy, cx + dx
-                            if 0 <= ny < self.map.grid_height and 0 <= nx < self.map.grid_width:
-                                blocked[ny, nx] = True
-        
-        return blocked
+        if k <= 0:
+            return mask
+        if binary_dilation is not None:
+            return binary_dilation(mask, structure=np.ones((2 * k + 1, 2 * k + 1), dtype=bool))
+        if _dilate_numba is not None:
+            return _dilate_numba(mask, k)
+        return _dilate_numpy(mask, k)
+    
+    def _build_nearest_free_index(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Precompute the nearest free cell for every cell (needs SciPy)"""
+        if distance_transform_edt is None or self.blocked.all():
+            return None, None
+        _, (idx_y, idx_x) = distance_transform_edt(self.blocked, return_indices=True)
+        return idx_x, idx_y
     
     def find_path(self, start: Point, goal: Point) -> List[Point]:
         """Find path from start to goal avoiding obstacles"""
@@ -106,7 +237,13 @@ class AStarPathfinder:
         return path
     
     def _find_nearest_free(self, cell: Tuple[int, int]) -> Optional[Tuple[int, int]]:
-        """Find nearest unblocked cell using BFS"""
+        """Find nearest unblocked cell (distance-transform lookup, BFS fallback)"""
+        if self._nearest_free_x is not None:
+            cx, cy = cell
+            return (int(self._nearest_free_x[cy, cx]), int(self._nearest_free_y[cy, cx]))
+        if self.blocked.all():
+            return None
+        
         from collections import deque
         
         visited = set()
@@ -135,63 +272,84 @@ class AStarPathfinder:
         start: Tuple[int, int],
         goal: Tuple[int, int]
     ) -> List[Tuple[int, int]]:
-        """A* algorithm"""
-        start_node = PathNode(start[0], start[1])
+        """A* algorithm (each cell is expanded at most once)"""
+        width = self.map.grid_width
+        height = self.map.grid_height
+        blocked = self.blocked
         
-        open_set = [start_node]
-        closed_set: Set[Tuple[int, int]] = set()
-        node_map: Dict[Tuple[int, int], PathNode] = {start: start_node}
+        start_id = int(start[1] * width + start[0])
+        goal_id = int(goal[1] * width + goal[0])
+        gx, gy = int(goal[0]), int(goal[1])
         
-        # 8-directional
+        g_cost = self._g_cost
+        parent = self._parent
+        closed = self._closed
+        open_set = self._open_set
+        touched = [start_id]    # Every cell given a g_cost, for the reset
+        
+        # 8-directional (dx, dy, move_cost)
         directions = [
-            (0, 1), (1, 0), (0, -1), (-1, 0),
-            (1, 1), (1, -1), (-1, 1), (-1, -1)
+            (0, 1, 1.0), (1, 0, 1.0), (0, -1, 1.0), (-1, 0, 1.0),
+            (1, 1, 1.414), (1, -1, 1.414), (-1, 1, 1.414), (-1, -1, 1.414)
         ]
         
         max_iterations = 50000
         iteration = 0
         
-        while open_set and iteration < max_iterations:
-            iteration += 1
-            current = heapq.heappop(open_set)
-            
-            if current.x == goal[0] and current.y == goal[1]:
-                # Reconstruct path
-                path = []
-                node = current
-                while node:
-                    path.append((node.x, node.y))
-                    node = node.parent
-                return path[::-1]
+        try:
+            g_cost[start_id] = 0.0
+            open_set.push(start_id, math.sqrt((start[0] - gx)**2 + (start[1] - gy)**2))
             
-            closed_set.add((current.x, current.y))
-            
-            for dx, dy in directions:
-                nx, ny = current.x + dx, current.y + dy
-                
-                if not (0 <= nx < self.map.grid_width and 0 <= ny < self.map.grid_height):
-                    continue
+            while open_set and iteration < max_iterations:
+                iteration += 1
+                current = open_set.pop()
                 
-                if self.blocked[ny, nx]:
-                    continue
+                if current == goal_id:
+                    # Reconstruct path
+                    path = []
+                    node = current
+                    while node != -1:
+                        path.append((node % width, node // width))
+                        node = parent[node]
+                    return path[::-1]
                 
-                if (nx, ny) in closed_set:
-                    continue
+                closed[current] = 1
+                cx, cy = current % width, current // width
+                current_g = g_cost[current]
                 
-                move_cost = 1.414 if (dx != 0 and dy != 0) else 1.0
-                g_cost = current.g_cost + move_cost
-                h_cost = math.sqrt((nx - goal[0])**2 + (ny - goal[1])**2)
-                
-                if (nx, ny) in node_map:
-                    if g_cost < node_map[(nx, ny)].g_cost:
-                        node_map[(nx, ny)].g_cost = g_cost
-                        node_map[(nx, ny)].parent = current
-                else:
-                    new_node = PathNode(nx, ny, g_cost, h_cost, current)
-                    node_map[(nx, ny)] = new_node
-                    heapq.heappush(open_set, new_node)
-        
-        return []
+                for dx, dy, move_cost in directions:
+                    nx, ny = cx + dx, cy + dy
+                    
+                    if not (0 <= nx < width and 0 <= ny < height):
+                        continue
+                    
+                    if blocked[ny, nx]:
+                        continue
+                    
+                    neighbor = ny * width + nx
+                    if closed[neighbor]:
+                        continue
+                    
+                    new_g = current_g + move_cost
+                    old_g = g_cost[neighbor]
+                    if new_g < old_g:
+                        if old_g == math.inf:
+                            touched.append(neighbor)
+                        g_cost[neighbor] = new_g
+                        parent[neighbor] = current
+                        f_cost = new_g + math.sqrt((nx - gx)**2 + (ny - gy)**2)
+                        if neighbor in open_set:
+                            open_set.decrease_key(neighbor, f_cost)
+                        else:
+                            open_set.push(neighbor, f_cost)
+            
+            return []
+        finally:
+            for cell in touched:
+                g_cost[cell] = math.inf
+                parent[cell] = -1
+                closed[cell] = 0
+            open_set.clear()
     
     def _simplify_path(self, path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """Remove unnecessary waypoints"""
@@ -219,8 +377,10 @@ class AStarPathfinder:
         dx = p2[0] - p1[0]
         dy = p2[1] - p1[1]
         steps = max(abs(dx), abs(dy), 1)
+        n_samples = steps + 1
         
-        for i in range(steps + 1):
+        lo = min(n_samples, _LINE_SCALAR_MAX)
+        for i in range(lo):
             t = i / steps
             x = int(p1[0] + t * dx)
             y = int(p1[1] + t * dy)
@@ -229,9 +389,48 @@ class AStarPathfinder:
                 if self.blocked[y, x]:
                     return False
         
+        # Long segments: growing chunks keep an early exit on the first hit
+        chunk = _LINE_CHUNK_SIZE
+        while lo < n_samples:
+            t = np.arange(lo, min(lo + chunk, n_samples)) / steps
+            xs = (p1[0] + t * dx).astype(np.intp)
+            ys = (p1[1] + t * dy).astype(np.intp)
+            
+            inside = (0 <= xs) & (xs < self.map.grid_width) & (0 <= ys) & (ys < self.map.grid_height)
+            if self.blocked[ys[inside], xs[inside]].any():
+                return False
+            lo += chunk
+            chunk *= 2
+        
         return True
 
 
+# Pathfinders keyed by (id(map), map.version, safety_cells), most recent last.
+# Each entry's pathfinder holds its map, so a keyed id can't be reused while
+# the entry exists; the cost is that up to _PATHFINDER_CACHE_SIZE maps (and
+# their blocked grids) stay alive until evicted
+_PATHFINDER_CACHE: "OrderedDict[Tuple[int, int, int], AStarPathfinder]" = OrderedDict()
+_PATHFINDER_CACHE_SIZE = 4
+
+
+def get_pathfinder(
+    surveillance_map: SurveillanceMap,
+    safety_cells: int = 5
+) -> AStarPathfinder:
+    """Return a cached AStarPathfinder for this map, building it on a miss"""
+    key = (id(surveillance_map), surveillance_map.version, safety_cells)
+    pathfinder = _PATHFINDER_CACHE.get(key)
+    if pathfinder is not None:
+        _PATHFINDER_CACHE.move_to_end(key)
+        return pathfinder
+    
+    pathfinder = AStarPathfinder(surveillance_map, safety_cells=safety_cells)
+    _PATHFINDER_CACHE[key] = pathfinder
+    if len(_PATHFINDER_CACHE) > _PATHFINDER_CACHE_SIZE:
+        _PATHFINDER_CACHE.popitem(last=False)
+    return pathfinder
+
+
 def plan_survey_mission(
     surveillance_map: SurveillanceMap,
     survey_points: List[Point],
@@ -246,7 +445,7 @@ def plan_survey_mission(
     if start is None:
         start = surveillance_map.start_position
     
-    pathfinder = AStarPathfinder(surveillance_map, safety_cells=6)
+    pathfinder = get_pathfinder(surveillance_map, safety_cells=6)
     
     full_path = []
     loiter_indices = []  # Which waypoint indices are loiter points
@@ -12,11 +12,18 @@ import math
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 from enum import Enum, auto
+import numpy as np
 
 from ..core.geometry import Point, normalize_angle
 from ..core.map import SurveillanceMap, CellType
 
 
+# Scan offsets for get_clear_direction: 10°..170° in 10° steps
+_DELTAS_RAD = np.radians(np.arange(10, 180, 10))
+_SIGNS_RIGHT = np.array([-1.0, 1.0])
+_SIGNS_LEFT = np.array([1.0, -1.0])
+
+
 class AvoidanceState(Enum):
     """States for the obstacle avoidance state machine"""
     NORMAL = auto()         # Flying normally toward target
@@ -48,48 +55,39 @@ class ObstacleDetector:
         """
         half_angle = math.radians(self.detection_angle / 2)
         
-        closest_dist = float('inf')
-        closest_point = None
+        # Spread rays across the detection FOV and cast them in one batch
+        ray_angles = heading - half_angle + (
+            2 * half_angle * np.arange(self.num_rays) / (self.num_rays - 1)
+        )
+        dists = self._cast_rays(position, ray_angles)
         
-        for i in range(self.num_rays):
-            # Spread rays across the detection FOV
-            ray_angle = heading - half_angle + (2 * half_angle * i / (self.num_rays - 1))
-            
-            # Cast ray
-            dist, hit_point = self._cast_ray(position, ray_angle)
-            
-            if dist < closest_dist:
-                closest_dist = dist
-                closest_point = hit_point
+        closest = int(np.argmin(dists))
+        closest_dist = float(dists[closest])
         
         if closest_dist < self.detection_range:
+            angle = float(ray_angles[closest])
+            closest_point = Point(
+                position.x + closest_dist * math.cos(angle),
+                position.y + closest_dist * math.sin(angle)
+            )
             return True, closest_dist, closest_point
         
         return False, None, None
     
-    def _cast_ray(
-        self, 
-        origin: Point, 
-        angle: float
-    ) -> Tuple[float, Optional[Point]]:
-        """Cast a single ray and return distance to first obstacle"""
+    def _cast_rays(self, origin: Point, angles: np.ndarray) -> np.ndarray:
+        """Cast a batch of rays and return distance to first obstacle per ray"""
         step_size = self.surveillance_map.resolution
         max_steps = int(self.detection_range / step_size)
+        if max_steps < 1:
+            return np.full(len(angles), np.inf)
+        dists = np.arange(1, max_steps + 1) * step_size
         
-        dx = math.cos(angle)
-        dy = math.sin(angle)
+        xs = origin.x + dists[None, :] * np.cos(angles)[:, None]
+        ys = origin.y + dists[None, :] * np.sin(angles)[:, None]
+        blocked = ~self.surveillance_map.are_points_safe(xs, ys)
         
-        for step in range(1, max_steps + 1):
-            dist = step * step_size
-            check_point = Point(
-                origin.x + dist * dx,
-                origin.y + dist * dy
-            )
-            
-            if not self.surveillance_map.is_point_safe(check_point):
-                return dist, check_point
-        
-        return float('inf'), None
+        hit = blocked.any(axis=1)
+        return np.where(hit, dists[np.argmax(blocked, axis=1)], np.inf)
     
     def get_clear_direction(
         self, 
@@ -103,20 +101,12 @@ class ObstacleDetector:
         Scans left and right to find a heading that's obstacle-free
         """
         # Check directions in order of preference
-        angles_to_check = []
+        signs = _SIGNS_RIGHT if prefer_right else _SIGNS_LEFT
+        angles = current_heading + (_DELTAS_RAD[:, None] * signs[None, :]).ravel()
         
-        for delta in range(10, 180, 10):
-            if prefer_right:
-                angles_to_check.append(current_heading - math.radians(delta))
-                angles_to_check.append(current_heading + math.radians(delta))
-            else:
-                angles_to_check.append(current_heading + math.radians(delta))
-                angles_to_check.append(current_heading - math.radians(delta))
-        
-        for angle in angles_to_check:
-            dist, _ = self._cast_ray(position, angle)
-            if dist > self.detection_range * 0.8:
-                return normalize_angle(angle)
+        clear = self._cast_rays(position, angles) > self.detection_range * 0.8
+        if clear.any():
+            return normalize_angle(float(angles[np.argmax(clear)]))
         
         return None
     
@@ -132,19 +122,17 @@ class ObstacleDetector:
         
         The drone will move parallel to the obstacle, keeping it on one side
         """
-        # Vector from drone to obstacle
-        to_obstacle = Point(
-            obstacle_point.x - position.x,
-            obstacle_point.y - position.y
-        )
+        # Bearing from drone to obstacle (raw floats, no vector Point)
+        bearing = math.atan2(obstacle_point.y - position.y,
+                             obstacle_point.x - position.x)
         
         # Perpendicular direction (along the edge)
         if follow_right:
             # Keep obstacle on right, so turn left (perpendicular)
-            edge_heading = math.atan2(to_obstacle.y, to_obstacle.x) + math.pi/2
+            edge_heading = bearing + math.pi/2
         else:
             # Keep obstacle on left, so turn right
-            edge_heading = math.atan2(to_obstacle.y, to_obstacle.x) - math.pi/2
+            edge_heading = bearing - math.pi/2
         
         return normalize_angle(edge_heading)
 
@@ -210,9 +198,15 @@ class ReactiveAvoidance:
         
         elif self.state == AvoidanceState.AVOIDING:
             # Check if we can resume direct path
-            dist_from_start = position.distance_to(self.avoidance_start_pos) if self.avoidance_start_pos else 0
+            # Squared distance avoids a sqrt per tick
+            if self.avoidance_start_pos:
+                dx = position.x - self.avoidance_start_pos.x
+                dy = position.y - self.avoidance_start_pos.y
+                dist_from_start_sq = dx * dx + dy * dy
+            else:
+                dist_from_start_sq = 0.0
             
-            if dist_from_start > self.min_avoidance_distance:
+            if dist_from_start_sq > self.min_avoidance_distance ** 2:
                 # Check if path to target is clear
                 target_clear, target_dist, _ = self.detector.detect_obstacle_ahead(
                     position, target_heading
@@ -4,15 +4,88 @@ Plans smooth transitions between loiter patterns using Dubins paths
 """
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
+import numpy as np
 
 from ..core.geometry import Point
 from ..core.loiter import Loiter
-from ..core.dubins import DubinsPath, generate_dubins_path
+from ..core.dubins import (
+    DubinsContext, DubinsPath, generate_dubins_path, generate_dubins_paths,
+    make_dubins_context
+)
 from ..core.map import SurveillanceMap
 
 
+def _precompute(
+    loiters: List[Loiter]
+) -> Tuple[List[Point], List[float], List[Point], List[float]]:
+    """Exit/entry points and headings for each loiter, computed once"""
+    exit_pts = [l.get_exit_point() for l in loiters]
+    exit_hdgs = [l.exit_heading for l in loiters]
+    entry_pts = [l.get_entry_point() for l in loiters]
+    entry_hdgs = [l.entry_heading for l in loiters]
+    return exit_pts, exit_hdgs, entry_pts, entry_hdgs
+
+
+def _nearest_neighbor_tour(dist_sq: np.ndarray) -> List[int]:
+    """
+    Nearest-neighbor tour from stop 0, hopping exit point -> nearest center
+    
+    A masked argmin over the rows of the precomputed dist_sq (squared
+    distances rank the same as distances).
+    """
+    n = len(dist_sq)
+    tour = [0]
+    # Visited centers are masked out by setting their column to inf
+    remaining = dist_sq.astype(float, copy=True)
+    remaining[:, 0] = np.inf
+    
+    for _ in range(1, n):
+        nxt = int(np.argmin(remaining[tour[-1]]))
+        tour.append(nxt)
+        remaining[:, nxt] = np.inf
+    
+    return tour
+
+
+def _two_opt(tour: List[int], dist: np.ndarray, max_passes: int = 20) -> List[int]:
+    """
+    Improve an open tour (first stop fixed) by 2-opt segment reversals
+    
+    dist may be asymmetric, so the reversed segment's interior edges are
+    re-costed rather than assumed unchanged.
+    """
+    tour = np.asarray(tour)
+    n = len(tour)
+    
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, n - 1):
+            for j in range(i + 1, n):
+                a, first, last = tour[i - 1], tour[i], tour[j]
+                seg = tour[i:j + 1]
+                
+                before = dist[a, first] + dist[seg[:-1], seg[1:]].sum()
+                after = dist[a, last] + dist[seg[:0:-1], seg[-2::-1]].sum()
+                if j + 1 < n:
+                    b = tour[j + 1]
+                    before += dist[last, b]
+                    after += dist[first, b]
+                
+                if after < before - 1e-9:
+                    tour[i:j + 1] = seg[::-1].copy()
+                    improved = True
+        if not improved:
+            break
+    
+    return tour.tolist()
+
+
+# Entry heading offsets tried when the direct transition is blocked
+_ENTRY_OFFSETS = np.array([0, math.pi/4, -math.pi/4, math.pi/2, -math.pi/2])
+
+
 @dataclass
 class TransitionPlanner:
     """
@@ -25,6 +98,17 @@ class TransitionPlanner:
     safety_margin: float = 20.0
     surveillance_map: Optional[SurveillanceMap] = None
     
+    _dubins_ctx: DubinsContext = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self._dubins_ctx = make_dubins_context(self.turn_radius)
+    
+    def _context(self) -> DubinsContext:
+        """Dubins context for the current turn radius (rebuilt if it was changed)"""
+        if self._dubins_ctx.turn_radius != self.turn_radius:
+            self._dubins_ctx = make_dubins_context(self.turn_radius)
+        return self._dubins_ctx
+    
     def plan_transition(
         self,
         from_loiter: Loiter,
@@ -33,25 +117,34 @@ class TransitionPlanner:
         """
         Plan a Dubins path from one loiter exit to another loiter entry
         """
-        exit_point = from_loiter.get_exit_point()
-        exit_heading = from_loiter.exit_heading
-        
-        # Calculate optimal entry heading for the target loiter
-        # (heading that aligns with the loiter's rotation direction)
-        entry_point = to_loiter.get_entry_point()
-        entry_heading = to_loiter.entry_heading
-        
+        # Entry heading aligns with the target loiter's rotation direction
+        return self._plan_transition_between(
+            from_loiter, to_loiter,
+            from_loiter.get_exit_point(), from_loiter.exit_heading,
+            to_loiter.get_entry_point(), to_loiter.entry_heading
+        )
+    
+    def _plan_transition_between(
+        self,
+        from_loiter: Loiter,
+        to_loiter: Loiter,
+        exit_point: Point,
+        exit_heading: float,
+        entry_point: Point,
+        entry_heading: float
+    ) -> Optional[DubinsPath]:
+        """plan_transition with exit/entry configurations already computed"""
         path = generate_dubins_path(
             exit_point, exit_heading,
             entry_point, entry_heading,
-            self.turn_radius
+            self.turn_radius, self._context()
         )
         
         # Validate path doesn't intersect obstacles
         if path and self.surveillance_map:
             if not self._validate_path(path):
                 # Try alternative entry points
-                path = self._find_safe_transition(from_loiter, to_loiter)
+                path = self._find_safe_transition(from_loiter, to_loiter, exit_point)
         
         return path
     
@@ -70,7 +163,7 @@ class TransitionPlanner:
         return generate_dubins_path(
             exit_point, exit_heading,
             base_position, base_heading,
-            self.turn_radius
+            self.turn_radius, self._context()
         )
     
     def _validate_path(self, path: DubinsPath) -> bool:
@@ -78,42 +171,39 @@ class TransitionPlanner:
         if not self.surveillance_map:
             return True
         
-        for waypoint in path.waypoints:
-            if not self.surveillance_map.is_point_safe(waypoint):
-                return False
-        
-        return True
+        xy = path.xy
+        return bool(self.surveillance_map.are_points_safe(xy[:, 0], xy[:, 1]).all())
     
     def _find_safe_transition(
         self,
         from_loiter: Loiter,
-        to_loiter: Loiter
+        to_loiter: Loiter,
+        exit_point: Optional[Point] = None
     ) -> Optional[DubinsPath]:
         """
         Try to find a safe transition by adjusting entry/exit points
         """
-        # Try different entry angles
-        for angle_offset in [0, math.pi/4, -math.pi/4, math.pi/2, -math.pi/2]:
-            adjusted_entry_heading = to_loiter.entry_heading + angle_offset
-            
-            # Calculate new entry point
-            entry_x = to_loiter.center.x + to_loiter.radius * math.cos(adjusted_entry_heading)
-            entry_y = to_loiter.center.y + to_loiter.radius * math.sin(adjusted_entry_heading)
-            entry_point = Point(entry_x, entry_y)
-            
+        if exit_point is None:
             exit_point = from_loiter.get_exit_point()
-            exit_heading = from_loiter.exit_heading
-            
-            path = generate_dubins_path(
-                exit_point, exit_heading,
-                entry_point, adjusted_entry_heading,
-                self.turn_radius
-            )
-            
-            if path and self._validate_path(path):
-                return path
+        exit_heading = from_loiter.exit_heading
+        
+        # Try different entry angles, solving all candidates in one batch
+        headings = to_loiter.entry_heading + _ENTRY_OFFSETS
+        entry_x = to_loiter.center.x + to_loiter.radius * np.cos(headings)
+        entry_y = to_loiter.center.y + to_loiter.radius * np.sin(headings)
+        entries = [Point(x, y) for x, y in zip(entry_x.tolist(), entry_y.tolist())]
+        
+        paths = generate_dubins_paths(
+            exit_point, exit_heading,
+            entries, headings,
+            self.turn_radius, self._context()
+        )
         
-        return None
+        # Shortest candidate that clears obstacles
+        safe = [p for p in paths if p and self._validate_path(p)]
+        if not safe:
+            return None
+        return min(safe, key=lambda p: p.total_length)
     
     def optimize_loiter_sequence(
         self,
@@ -122,49 +212,56 @@ class TransitionPlanner:
         """
         Optimize the order of loiters to minimize total transition distance
         
-        Uses a simple nearest-neighbor heuristic (could be improved with TSP solvers)
+        Euclidean TSP first, Dubins lengths second: a nearest-neighbor tour
+        on the exit→center distance matrix, refined with 2-opt.
         """
         if len(loiters) <= 2:
             return loiters, self._calculate_total_transition_distance(loiters)
         
-        # Start with first loiter fixed
-        optimized = [loiters[0]]
-        remaining = list(loiters[1:])
+        # D[i, j] = distance from loiter i's exit point to loiter j's center
+        endpoints = _precompute(loiters)
+        exits = endpoints[0]
+        ex = np.array([p.x for p in exits])
+        ey = np.array([p.y for p in exits])
+        cx = np.array([l.center.x for l in loiters])
+        cy = np.array([l.center.y for l in loiters])
+        dx = ex[:, None] - cx[None, :]
+        dy = ey[:, None] - cy[None, :]
+        dist_sq = dx*dx + dy*dy
+        
+        # Nearest neighbor, starting with first loiter fixed
+        tour = _nearest_neighbor_tour(dist_sq)
         
-        while remaining:
-            current = optimized[-1]
-            exit_point = current.get_exit_point()
-            
-            # Find nearest remaining loiter
-            best_idx = 0
-            best_dist = float('inf')
-            
-            for i, loiter in enumerate(remaining):
-                dist = exit_point.distance_to(loiter.center)
-                if dist < best_dist:
-                    best_dist = dist
-                    best_idx = i
-            
-            optimized.append(remaining.pop(best_idx))
+        # 2-opt sums edge lengths, so it needs true distances
+        tour = _two_opt(tour, np.sqrt(dist_sq))
         
-        total_distance = self._calculate_total_transition_distance(optimized)
+        optimized = [loiters[i] for i in tour]
+        total_distance = self._calculate_total_transition_distance(
+            optimized, tuple([values[i] for i in tour] for values in endpoints)
+        )
         return optimized, total_distance
     
     def _calculate_total_transition_distance(
         self,
-        loiters: List[Loiter]
+        loiters: List[Loiter],
+        endpoints: Optional[Tuple[List[Point], List[float], List[Point], List[float]]] = None
     ) -> float:
         """Calculate total transition distance for a sequence of loiters"""
+        if endpoints is None:
+            endpoints = _precompute(loiters)
+        exit_pts, exit_hdgs, entry_pts, entry_hdgs = endpoints
         total = 0.0
         
         for i in range(len(loiters) - 1):
-            path = self.plan_transition(loiters[i], loiters[i + 1])
+            path = self._plan_transition_between(
+                loiters[i], loiters[i + 1],
+                exit_pts[i], exit_hdgs[i],
+                entry_pts[i + 1], entry_hdgs[i + 1]
+            )
             if path:
                 total += path.total_length
             else:
                 # Fallback to straight-line distance
-                total += loiters[i].get_exit_point().distance_to(
-                    loiters[i + 1].get_entry_point()
-                )
+                total += exit_pts[i].distance_to(entry_pts[i + 1])
         
         return total
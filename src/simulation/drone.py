@@ -4,11 +4,98 @@ Drone with visible loitering and coverage tracking
 
 import math
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Callable, Dict, List, Optional, Sequence, Set
 from enum import Enum, auto
 
+import numpy as np
+
 from ..core.geometry import Point, normalize_angle
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - kernels run as plain Python
+    njit = None
+
+
+_TWO_PI = 2 * math.pi
+
+
+def _step_kinematics(px, py, hdg, tx, ty, speed, turn_rate, dt):
+    """
+    Turn toward (tx, ty) at most turn_rate*dt, then move forward
+    
+    Returns (px, py, heading, squared_distance_to_target)
+    """
+    # Loops rather than one conditional wrap: hdg may come in outside
+    # [-pi, pi] (any constructor heading); in range each runs at most once
+    target_heading = math.atan2(ty - py, tx - px)
+    heading_error = target_heading - hdg
+    while heading_error > math.pi:
+        heading_error -= _TWO_PI
+    while heading_error < -math.pi:
+        heading_error += _TWO_PI
+    
+    max_turn = turn_rate * dt
+    if abs(heading_error) > max_turn:
+        hdg += max_turn if heading_error > 0 else -max_turn
+    else:
+        hdg = target_heading
+    while hdg > math.pi:
+        hdg -= _TWO_PI
+    while hdg < -math.pi:
+        hdg += _TWO_PI
+    
+    distance = speed * dt
+    px += distance * math.cos(hdg)
+    py += distance * math.sin(hdg)
+    dx = tx - px
+    dy = ty - py
+    return px, py, hdg, dx*dx + dy*dy
+
+
+if njit is not None:
+    _step_kinematics = njit(cache=True, fastmath=True)(_step_kinematics)
+
+
+_INITIAL_BUFFER = 256
+
+# Where a drone starts when no position is given
+_START = Point(50, 50)
+
+# Coverage scatter: points per simulated tick, emitted every few meters
+_COVERAGE_PER_TICK = 3
+_COVERAGE_SPACING = 5.0
+
+
+def _grow(buf: np.ndarray, needed: int) -> np.ndarray:
+    """Copy buf into a buffer with room for at least `needed` rows (capacity doubles)"""
+    cap = len(buf)
+    while cap < needed:
+        cap *= 2
+    out = np.empty((cap,) + buf.shape[1:], dtype=buf.dtype)
+    out[:len(buf)] = buf
+    return out
+
+
+class _PositionField:
+    """
+    Dataclass field descriptor storing a Point as raw floats in _px/_py
+    
+    Read on the class it gives the field default (None, meaning the
+    (50, 50) start), so `position` stays an ordinary constructor argument
+    while the hot loop works on _px/_py directly.
+    """
+    
+    def __get__(self, drone, owner=None) -> Optional[Point]:
+        if drone is None:
+            return None
+        return Point(drone._px, drone._py)
+    
+    def __set__(self, drone, point: Optional[Point]) -> None:
+        if point is None:
+            point = _START
+        drone._px, drone._py = point.x, point.y
+
 
 class DroneState(Enum):
     IDLE = auto()
@@ -23,7 +110,10 @@ class SimpleDrone:
     """
     Drone with visible loitering and coverage tracking
     """
-    position: Point = field(default_factory=lambda: Point(50, 50))
+    # Position is held as raw floats in _px/_py; `position` is a Point view
+    position: Optional[Point] = _PositionField()
+    _px: float = field(default=50.0, init=False, repr=False, compare=False)
+    _py: float = field(default=50.0, init=False, repr=False, compare=False)
     heading: float = 0.0
     speed: float = 30.0
     
@@ -40,6 +130,13 @@ class SimpleDrone:
     loiter_revolutions: float = 0.0    # How many circles completed
     loiter_target_revs: float = 1.0    # Do 1 full circle
     
+    # cos/sin of loiter_angle, advanced by rotation instead of trig each tick
+    _loiter_cos: float = field(default=1.0, init=False, repr=False, compare=False)
+    _loiter_sin: float = field(default=0.0, init=False, repr=False, compare=False)
+    _rot_dtheta: float = field(default=0.0, init=False, repr=False, compare=False)
+    _rot_cos: float = field(default=1.0, init=False, repr=False, compare=False)
+    _rot_sin: float = field(default=0.0, init=False, repr=False, compare=False)
+    
     # Physical
     turn_rate: float = 2.5
     
@@ -50,10 +147,35 @@ class SimpleDrone:
     # State
     state: DroneState = DroneState.IDLE
     distance_traveled: float = 0.0
-    path_history: List[Point] = field(default_factory=list)
     
-    # Coverage - points that have been scanned
-    coverage_points: List[Point] = field(default_factory=list)
+    # Path and coverage points as (n, 2) float32 buffers, doubled on overflow
+    _path_buf: np.ndarray = field(
+        default_factory=lambda: np.empty((_INITIAL_BUFFER, 2), dtype=np.float32),
+        init=False, repr=False, compare=False
+    )
+    _path_len: int = field(default=0, init=False, repr=False, compare=False)
+    _cov_buf: np.ndarray = field(
+        default_factory=lambda: np.empty((_INITIAL_BUFFER, 2), dtype=np.float32),
+        init=False, repr=False, compare=False
+    )
+    _cov_len: int = field(default=0, init=False, repr=False, compare=False)
+    
+    # Coverage is emitted in bulk every _COVERAGE_SPACING meters; ticks since
+    # the last batch, where that batch was centered, and the distance mark
+    _cov_pending: int = field(default=0, init=False, repr=False, compare=False)
+    _cov_anchored: bool = field(default=False, init=False, repr=False, compare=False)
+    _cov_ax: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cov_ay: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cov_cx: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cov_cy: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cov_radius: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cov_mark: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    # Seeded so coverage scatter is reproducible between runs
+    _rng: np.random.Generator = field(
+        default_factory=lambda: np.random.default_rng(0),
+        init=False, repr=False, compare=False
+    )
     
     def set_mission(
         self, 
@@ -65,55 +187,46 @@ class SimpleDrone:
         self.loiter_indices = set(loiter_indices or [])
         self.current_waypoint_idx = 0
         self.state = DroneState.FLYING
-        self.path_history = [Point(self.position.x, self.position.y)]
-        self.coverage_points = []
+        self._path_len = 0
+        self._cov_len = 0
+        self._cov_pending = 0
+        self._cov_anchored = False
+        self._cov_mark = self.distance_traveled
+        self._record_path(self._px, self._py)
     
     def update(self, dt: float) -> bool:
         """Update drone - returns True if waypoint reached"""
-        if self.state in (DroneState.IDLE, DroneState.LANDED):
-            return False
-        
-        # Handle loitering
-        if self.state == DroneState.LOITERING:
-            return self._update_loiter(dt)
-        
+        return _DISPATCH[self.state](self, dt)
+    
+    def _update_flight(self, dt: float) -> bool:
+        """Fly toward the current waypoint (FLYING / RETURNING)"""
         # Check mission complete
         if self.current_waypoint_idx >= len(self.waypoints):
             self.state = DroneState.LANDED
+            self._flush_coverage()
             return False
         
         target = self.waypoints[self.current_waypoint_idx]
         
-        # Turn toward target
-        target_heading = self.position.heading_to(target)
-        heading_error = normalize_angle(target_heading - self.heading)
-        
-        max_turn = self.turn_rate * dt
-        if abs(heading_error) > max_turn:
-            self.heading += max_turn if heading_error > 0 else -max_turn
-        else:
-            self.heading = target_heading
-        self.heading = normalize_angle(self.heading)
-        
-        # Move forward
-        distance = self.speed * dt
-        self.position = Point(
-            self.position.x + distance * math.cos(self.heading),
-            self.position.y + distance * math.sin(self.heading)
+        # Turn toward target and move forward
+        px, py, self.heading, dist_sq = _step_kinematics(
+            self._px, self._py, self.heading,
+            target.x, target.y, self.speed, self.turn_rate, dt
         )
+        self._px, self._py = px, py
+        distance = self.speed * dt
         
         self.distance_traveled += distance
         self.battery -= self.energy_rate * dt
         
-        # Record path and coverage
-        if len(self.path_history) == 0 or self.position.distance_to(self.path_history[-1]) > 5:
-            self.path_history.append(Point(self.position.x, self.position.y))
+        # Record path (5 m spacing, squared) and coverage
+        self._record_path(px, py, 25.0)
         
         # Add coverage points along path
-        self._add_coverage(self.position, 40)
+        self._add_coverage(px, py, 40)
         
         # Check waypoint reached
-        if self.position.distance_to(target) < self.waypoint_radius:
+        if dist_sq < self.waypoint_radius * self.waypoint_radius:
             # Check if this is a loiter point
             if self.current_waypoint_idx in self.loiter_indices:
                 self._start_loiter(target)
@@ -135,6 +248,8 @@ class SimpleDrone:
         self.loiter_center = center
         self.loiter_angle = self.heading - math.pi / 2  # Start tangent to entry
         self.loiter_revolutions = 0.0
+        self._loiter_cos = math.cos(self.loiter_angle)
+        self._loiter_sin = math.sin(self.loiter_angle)
     
     def _update_loiter(self, dt: float) -> bool:
         """Update loiter circle motion"""
@@ -142,31 +257,33 @@ class SimpleDrone:
             self.state = DroneState.FLYING
             return False
         
-        # Angular speed (rad/s) based on linear speed and radius
-        angular_speed = self.speed / self.loiter_radius
-        
-        # Update angle
-        self.loiter_angle += angular_speed * dt
-        self.loiter_revolutions += angular_speed * dt / (2 * math.pi)
-        
-        # Calculate position on circle
-        self.position = Point(
-            self.loiter_center.x + self.loiter_radius * math.cos(self.loiter_angle),
-            self.loiter_center.y + self.loiter_radius * math.sin(self.loiter_angle)
-        )
+        # Advance around the circle by rotating (cos, sin); dtheta is
+        # constant for a fixed dt, so its trig is only recomputed on change
+        dtheta = self.speed / self.loiter_radius * dt
+        if dtheta != self._rot_dtheta:
+            self._rot_dtheta = dtheta
+            self._rot_cos = math.cos(dtheta)
+            self._rot_sin = math.sin(dtheta)
+        c, s = self._loiter_cos, self._loiter_sin
+        c, s = c * self._rot_cos - s * self._rot_sin, s * self._rot_cos + c * self._rot_sin
+        self._loiter_cos, self._loiter_sin = c, s
+        self.loiter_angle += dtheta
         
-        # Heading is tangent to circle
-        self.heading = normalize_angle(self.loiter_angle + math.pi / 2)
+        # Heading stays tangent: direction (-sin, cos)
+        self.heading = math.atan2(c, -s)
+        px = self.loiter_center.x + self.loiter_radius * c
+        py = self.loiter_center.y + self.loiter_radius * s
+        self._px, self._py = px, py
+        self.loiter_revolutions += dtheta / (2 * math.pi)
         
         self.distance_traveled += self.speed * dt
         self.battery -= self.energy_rate * dt
         
-        # Record path
-        if len(self.path_history) == 0 or self.position.distance_to(self.path_history[-1]) > 3:
-            self.path_history.append(Point(self.position.x, self.position.y))
+        # Record path (3 m spacing, squared)
+        self._record_path(px, py, 9.0)
         
         # Add coverage in loiter area (larger radius during loiter)
-        self._add_coverage(self.loiter_center, self.loiter_radius + 30)
+        self._add_coverage(self.loiter_center.x, self.loiter_center.y, self.loiter_radius + 30)
         
         # Check if loiter complete
         if self.loiter_revolutions >= self.loiter_target_revs:
@@ -177,17 +294,70 @@ class SimpleDrone:
         
         return False
     
-    def _add_coverage(self, center: Point, radius: float) -> None:
-        """Add coverage points around a center"""
-        # Add some random points within radius to show coverage
-        for _ in range(3):
-            angle = self.heading + (hash(str(self.distance_traveled)) % 100) / 50.0 - 1.0
-            dist = radius * 0.5
-            pt = Point(
-                center.x + dist * math.cos(angle),
-                center.y + dist * math.sin(angle)
-            )
-            self.coverage_points.append(pt)
+    def _add_coverage(self, cx: float, cy: float, radius: float) -> None:
+        """Queue this tick's coverage points; emitted in batches along the path"""
+        if radius != self._cov_radius:
+            # Switched between flight and loiter coverage - close out the batch
+            self._flush_coverage()
+            self._cov_anchored = False
+        if not self._cov_anchored:
+            self._cov_ax, self._cov_ay = cx, cy
+            self._cov_anchored = True
+        self._cov_radius = radius
+        self._cov_pending += 1
+        self._cov_cx, self._cov_cy = cx, cy
+        
+        if self.distance_traveled - self._cov_mark >= _COVERAGE_SPACING:
+            self._flush_coverage()
+    
+    def _flush_coverage(self) -> None:
+        """Emit 3 coverage points per queued tick in one vectorized draw"""
+        ticks = self._cov_pending
+        if not ticks:
+            return
+        k = _COVERAGE_PER_TICK * ticks
+        
+        # Spread the batch along the segment from the last batch's center
+        ax, ay = self._cov_ax, self._cov_ay
+        bx, by = self._cov_cx, self._cov_cy
+        t = np.repeat(np.arange(1, ticks + 1) / ticks, _COVERAGE_PER_TICK)
+        angles = self.heading + self._rng.uniform(-1.0, 1.0, k)
+        dist = self._cov_radius * 0.5
+        
+        n = self._cov_len
+        if n + k > len(self._cov_buf):
+            self._cov_buf = _grow(self._cov_buf, n + k)
+        self._cov_buf[n:n + k, 0] = ax + t * (bx - ax) + dist * np.cos(angles)
+        self._cov_buf[n:n + k, 1] = ay + t * (by - ay) + dist * np.sin(angles)
+        self._cov_len = n + k
+        
+        self._cov_pending = 0
+        self._cov_ax, self._cov_ay = bx, by
+        self._cov_mark = self.distance_traveled
+    
+    def _record_path(self, px: float, py: float, min_spacing_sq: float = 0.0) -> None:
+        """Append to path history once we've moved more than sqrt(min_spacing_sq)"""
+        n = self._path_len
+        if n:
+            last = self._path_buf[n - 1]
+            dx = px - float(last[0])
+            dy = py - float(last[1])
+            if dx*dx + dy*dy <= min_spacing_sq:
+                return
+        if n == len(self._path_buf):
+            self._path_buf = _grow(self._path_buf, n + 1)
+        self._path_buf[n] = px, py
+        self._path_len = n + 1
+    
+    @property
+    def path_history(self) -> np.ndarray:
+        """Recorded path as an (n, 2) view into the history buffer"""
+        return self._path_buf[:self._path_len]
+    
+    @property
+    def coverage_points(self) -> np.ndarray:
+        """Coverage scatter as an (n, 2) view into the coverage buffer"""
+        return self._cov_buf[:self._cov_len]
     
     @property
     def is_loitering(self) -> bool:
@@ -201,7 +371,7 @@ class SimpleDrone:
     
     def get_status(self) -> dict:
         return {
-            'position': (self.position.x, self.position.y),
+            'position': (self._px, self._py),
             'heading': math.degrees(self.heading),
             'speed': self.speed,
             'battery': self.battery,
@@ -210,5 +380,200 @@ class SimpleDrone:
             'progress': self.progress,
             'waypoint': f"{self.current_waypoint_idx + 1}/{len(self.waypoints)}",
             'loiter_center': self.loiter_center,
-            'coverage_count': len(self.coverage_points)
+            'coverage_count': self._cov_len
         }
+
+
+def _no_update(drone: SimpleDrone, dt: float) -> bool:
+    """Handler for states that don't move (IDLE / LANDED)"""
+    return False
+
+
+# State -> per-tick handler, called as handler(drone, dt). Unbound functions,
+# so copies of a drone dispatch on themselves and no drone holds a cycle
+_DISPATCH: Dict[DroneState, Callable[[SimpleDrone, float], bool]] = {
+    DroneState.IDLE: _no_update,
+    DroneState.FLYING: SimpleDrone._update_flight,
+    DroneState.LOITERING: SimpleDrone._update_loiter,
+    DroneState.RETURNING: SimpleDrone._update_flight,
+    DroneState.LANDED: _no_update,
+}
+
+
+def _wrap_angles(a: np.ndarray) -> np.ndarray:
+    """Vectorized normalize_angle into [-pi, pi)"""
+    return (a + math.pi) % (2 * math.pi) - math.pi
+
+
+_IDLE = DroneState.IDLE.value
+_FLYING = DroneState.FLYING.value
+_LOITERING = DroneState.LOITERING.value
+_RETURNING = DroneState.RETURNING.value
+_LANDED = DroneState.LANDED.value
+
+
+class DroneSwarm:
+    """
+    N drones ticked in lockstep with structure-of-arrays state
+    
+    Same flight and loiter model as SimpleDrone, but one update() call
+    advances every drone with NumPy ops instead of N Python calls.
+    Path history and coverage points are not tracked, which is why
+    SimpleDrone keeps its own scalar state rather than being a view into
+    a one-drone swarm.
+    """
+    
+    def __init__(
+        self,
+        positions: np.ndarray,
+        headings: Optional[np.ndarray] = None,
+        speed: float = 30.0,
+        waypoint_radius: float = 20.0,
+        loiter_radius: float = 60.0,
+        loiter_target_revs: float = 1.0,
+        turn_rate: float = 2.5,
+        energy_rate: float = 0.12
+    ):
+        self.positions = np.array(positions, dtype=float).reshape(-1, 2)
+        n = len(self.positions)
+        self.headings = (np.zeros(n) if headings is None
+                         else np.array(headings, dtype=float).reshape(n))
+        self.speeds = np.full(n, speed, dtype=float)
+        self.states = np.full(n, _IDLE, dtype=np.int8)
+        self.battery = np.full(n, 100.0)
+        self.distance_traveled = np.zeros(n)
+        
+        self.waypoint_radius = waypoint_radius
+        self.loiter_radius = loiter_radius
+        self.loiter_target_revs = loiter_target_revs
+        self.turn_rate = turn_rate
+        self.energy_rate = energy_rate
+        
+        # Navigation - waypoints padded to the longest mission
+        self.waypoints = np.zeros((n, 0, 2))
+        self.is_loiter_wp = np.zeros((n, 0), dtype=bool)
+        self.num_waypoints = np.zeros(n, dtype=np.intp)
+        self.waypoint_idx = np.zeros(n, dtype=np.intp)
+        
+        # Loiter state
+        self.loiter_centers = np.zeros((n, 2))
+        self.loiter_angles = np.zeros(n)
+        self.loiter_revolutions = np.zeros(n)
+    
+    def __len__(self) -> int:
+        return len(self.positions)
+    
+    def set_missions(
+        self,
+        paths: Sequence[List[Point]],
+        loiter_indices: Optional[Sequence[Optional[List[int]]]] = None
+    ) -> None:
+        """Set one mission per drone (paths[i] flies drone i)"""
+        n = len(self)
+        if len(paths) != n:
+            raise ValueError(f"Expected {n} paths, got {len(paths)}")
+        if loiter_indices is None:
+            loiter_indices = [None] * n
+        
+        max_len = max((len(p) for p in paths), default=0)
+        self.waypoints = np.zeros((n, max_len, 2))
+        self.is_loiter_wp = np.zeros((n, max_len), dtype=bool)
+        self.num_waypoints = np.array([len(p) for p in paths], dtype=np.intp)
+        for i, path in enumerate(paths):
+            if path:
+                self.waypoints[i, :len(path)] = [(p.x, p.y) for p in path]
+            for j in loiter_indices[i] or []:
+                if 0 <= j < len(path):
+                    self.is_loiter_wp[i, j] = True
+        
+        self.waypoint_idx[:] = 0
+        self.states[:] = _FLYING
+    
+    def update(self, dt: float) -> np.ndarray:
+        """Advance all drones - returns a bool mask of drones that reached a waypoint"""
+        reached = np.zeros(len(self), dtype=bool)
+        
+        # Dispatch on state before either branch mutates it
+        loitering = np.flatnonzero(self.states == _LOITERING)
+        flying = (self.states == _FLYING) | (self.states == _RETURNING)
+        
+        finished = flying & (self.waypoint_idx >= self.num_waypoints)
+        self.states[finished] = _LANDED
+        flying = np.flatnonzero(flying & ~finished)
+        
+        if len(flying):
+            self._update_flight(flying, dt, reached)
+        if len(loitering):
+            self._update_loiter(loitering, dt, reached)
+        return reached
+    
+    def _update_flight(self, idx: np.ndarray, dt: float, reached: np.ndarray) -> None:
+        """Turn toward the current waypoint and move forward"""
+        wp = self.waypoint_idx[idx]
+        target = self.waypoints[idx, wp]
+        pos = self.positions[idx]
+        
+        target_heading = np.arctan2(target[:, 1] - pos[:, 1], target[:, 0] - pos[:, 0])
+        heading_error = _wrap_angles(target_heading - self.headings[idx])
+        max_turn = self.turn_rate * dt
+        hdg = np.where(
+            np.abs(heading_error) > max_turn,
+            self.headings[idx] + np.sign(heading_error) * max_turn,
+            target_heading
+        )
+        hdg = _wrap_angles(hdg)
+        
+        step = self.speeds[idx] * dt
+        pos[:, 0] += step * np.cos(hdg)
+        pos[:, 1] += step * np.sin(hdg)
+        self.positions[idx] = pos
+        self.headings[idx] = hdg
+        self.distance_traveled[idx] += step
+        self.battery[idx] -= self.energy_rate * dt
+        
+        arrived = np.hypot(target[:, 0] - pos[:, 0], target[:, 1] - pos[:, 1]) < self.waypoint_radius
+        if not arrived.any():
+            return
+        
+        idx, wp, target, hdg = idx[arrived], wp[arrived], target[arrived], hdg[arrived]
+        reached[idx] = True
+        
+        # Loiter waypoints start a circle tangent to entry, others advance
+        loiter = self.is_loiter_wp[idx, wp]
+        start = idx[loiter]
+        self.states[start] = _LOITERING
+        self.loiter_centers[start] = target[loiter]
+        self.loiter_angles[start] = hdg[loiter] - math.pi / 2
+        self.loiter_revolutions[start] = 0.0
+        
+        advance = idx[~loiter]
+        self.waypoint_idx[advance] += 1
+        returning = advance[self.waypoint_idx[advance] >= self.num_waypoints[advance] - 3]
+        self.states[returning] = _RETURNING
+    
+    def _update_loiter(self, idx: np.ndarray, dt: float, reached: np.ndarray) -> None:
+        """Advance loitering drones around their circles"""
+        dtheta = self.speeds[idx] / self.loiter_radius * dt
+        angle = self.loiter_angles[idx] + dtheta
+        center = self.loiter_centers[idx]
+        
+        self.loiter_angles[idx] = angle
+        self.positions[idx, 0] = center[:, 0] + self.loiter_radius * np.cos(angle)
+        self.positions[idx, 1] = center[:, 1] + self.loiter_radius * np.sin(angle)
+        self.headings[idx] = _wrap_angles(angle + math.pi / 2)
+        self.loiter_revolutions[idx] += dtheta / (2 * math.pi)
+        self.distance_traveled[idx] += self.speeds[idx] * dt
+        self.battery[idx] -= self.energy_rate * dt
+        
+        done = idx[self.loiter_revolutions[idx] >= self.loiter_target_revs]
+        self.states[done] = _FLYING
+        self.waypoint_idx[done] += 1
+        reached[done] = True
+    
+    def drone_state(self, i: int) -> DroneState:
+        return DroneState(int(self.states[i]))
+    
+    @property
+    def active(self) -> np.ndarray:
+        """Mask of drones still flying their mission"""
+        return (self.states != _IDLE) & (self.states != _LANDED)
@@ -3,13 +3,21 @@ SUPARNA — Integrated Mission Visualization
 Uses CoveragePlanner, Loiter patterns, Dubins transitions, and real coverage tracking
 """
 
+import functools
 import pygame
 import math
+import threading
+import time
 import numpy as np
 from typing import List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 
 from ..core.geometry import Point, normalize_angle
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - the flight/loiter kernels run as plain Python
+    njit = None
 from ..core.map import SurveillanceMap, Obstacle, CellType
 from ..core.loiter import Loiter, LoiterType
 from ..planners.coverage import CoveragePlanner, MissionPath
@@ -41,6 +49,225 @@ COLORS = {
 }
 
 
+# Simulation substep; frames advance by as many of these as fit in their dt
+FIXED_DT = 1.0 / 120.0
+# Cap on substeps per frame (5 s of simulated time)
+_MAX_SUBSTEPS = 600
+# Radius of the coverage scan in flight, in grid cells
+_SCAN_CELLS = 4
+# Within a frame, the drone is rescanned every this many meters (well under
+# the scan radius: disks spaced a full radius apart leave gaps at the edges)
+_SCAN_SPACING = 5.0
+
+# Batches of newly covered cells at least this large are painted through
+# surfarray rather than one rect at a time
+_BULK_PAINT_MIN = 64
+
+# Number of trail points kept for drawing
+TRAIL_LEN = 500
+# Trail points grouped under one dirty rect when presenting a frame
+_TRAIL_DIRTY_RUN = 25
+
+# Drone body outline at heading 0: a nose and two swept-back corners
+_DRONE_SHAPE = tuple((l * math.cos(a), l * math.sin(a))
+                     for l, a in ((12 * 1.8, 0.0), (12, 2.3), (12, -2.3)))
+
+# Edge-following offsets tried when curving back toward the target
+_CURVE_A = (0.3, 0.5, 0.7)
+_CURVE_COS = tuple(math.cos(a) for a in _CURVE_A)
+_CURVE_SIN = tuple(math.sin(a) for a in _CURVE_A)
+
+
+def _wrap_angle(a):
+    """normalize_angle, usable inside compiled kernels"""
+    # Numba has no math.remainder; compiled, these loops cost next to nothing
+    while a > math.pi:
+        a -= 2 * math.pi
+    while a < -math.pi:
+        a += 2 * math.pi
+    return a
+
+
+def _point_clear(x, y, obs_x, obs_y, obs_r2, geo, cell_start, cell_items):
+    """
+    True if (x, y) is outside every obstacle (centers obs_x/obs_y, squared
+    avoidance radii obs_r2)
+
+    Only obstacles listed in the point's cell of the uniform grid are
+    tested; geo is (x0, y0, 1/cell, cols, rows) and cell c holds
+    cell_items[cell_start[c]:cell_start[c + 1]]
+    """
+    gx = (x - geo[0]) * geo[2]
+    gy = (y - geo[1]) * geo[2]
+    if gx < 0.0 or gy < 0.0 or gx >= geo[3] or gy >= geo[4]:
+        return True  # Outside every obstacle's bounding box
+    c = int(gy) * int(geo[3]) + int(gx)
+    for k in range(cell_start[c], cell_start[c + 1]):
+        i = cell_items[k]
+        dx = x - obs_x[i]
+        dy = y - obs_y[i]
+        if dx * dx + dy * dy < obs_r2[i]:
+            return False
+    return True
+
+
+def _first_near(x, y, radius, obs_x, obs_y, geo, cell_start, cell_items):
+    """Lowest-index obstacle whose center is within radius of (x, y), or -1"""
+    # Every obstacle is listed in the cell holding its center, so scanning
+    # the cells under the query square finds all candidates
+    cols = int(geo[3])
+    gx0 = max(int(math.floor((x - radius - geo[0]) * geo[2])), 0)
+    gx1 = min(int(math.floor((x + radius - geo[0]) * geo[2])), cols - 1)
+    gy0 = max(int(math.floor((y - radius - geo[1]) * geo[2])), 0)
+    gy1 = min(int(math.floor((y + radius - geo[1]) * geo[2])), int(geo[4]) - 1)
+    best = -1
+    for gy in range(gy0, gy1 + 1):
+        for gx in range(gx0, gx1 + 1):
+            c = gy * cols + gx
+            for k in range(cell_start[c], cell_start[c + 1]):
+                i = cell_items[k]
+                if best != -1 and i >= best:
+                    continue
+                dx = obs_x[i] - x
+                dy = obs_y[i] - y
+                if dx * dx + dy * dy < radius * radius:
+                    best = i
+    return best
+
+
+def _flight_step(px, py, heading, tx, ty, obs_x, obs_y, obs_r2,
+                 geo, cell_start, cell_items, avoiding, avoid_dir,
+                 spd, turn_rate, dt):
+    """
+    One flight tick: edge-following avoidance, smooth turn, guarded move
+
+    Returns (px, py, heading, avoiding, avoid_dir, distance_moved)
+    """
+    # Target heading
+    th = math.atan2(ty - py, tx - px)
+    cos_th, sin_th = math.cos(th), math.sin(th)
+
+    # ── Obstacle avoidance (edge-following) ──
+    if _point_clear(px + 50.0 * cos_th, py + 50.0 * sin_th,
+                    obs_x, obs_y, obs_r2, geo, cell_start, cell_items):
+        # Path clear — fly direct
+        avoiding = False
+        desired = th
+    else:
+        # Path blocked — edge-follow around obstacle
+        if not avoiding:
+            avoiding = True
+            # Pick avoidance direction: turn away from nearest obstacle
+            i = _first_near(px, py, 200.0, obs_x, obs_y, geo, cell_start, cell_items)
+            if i >= 0:
+                diff = _wrap_angle(th - math.atan2(obs_y[i] - py, obs_x[i] - px))
+                avoid_dir = int(math.copysign(1.0, diff))
+
+        desired = heading + avoid_dir * 0.8
+
+        # Try to curve back toward target; candidate directions are the
+        # current heading rotated by fixed offsets (angle-sum identities).
+        # test_h is left unwrapped: the gap test wraps the difference and
+        # the chosen heading is wrapped after the turn
+        ch, sh = math.cos(heading), math.sin(heading)
+        for k in range(len(_CURVE_A)):
+            ca = _CURVE_COS[k]
+            sa = _CURVE_SIN[k] * avoid_dir
+            test_h = heading + avoid_dir * _CURVE_A[k]
+            if _point_clear(px + 60.0 * (ch * ca - sh * sa),
+                            py + 60.0 * (sh * ca + ch * sa),
+                            obs_x, obs_y, obs_r2, geo, cell_start, cell_items):
+                if abs(_wrap_angle(th - test_h)) < 1.5:
+                    desired = test_h
+                    break
+
+    # Smooth turning
+    err = _wrap_angle(desired - heading)
+    mt = turn_rate * dt
+    if abs(err) > mt:
+        heading += math.copysign(mt, err)
+    else:
+        heading = desired
+    heading = _wrap_angle(heading)
+
+    # Move forward (only if clear); flying straight at the target
+    # reuses its direction instead of recomputing the trig
+    if heading == th:
+        ch, sh = cos_th, sin_th
+    else:
+        ch, sh = math.cos(heading), math.sin(heading)
+    d = spd * dt
+    nx = px + d * ch
+    ny = py + d * sh
+    if _point_clear(nx, ny, obs_x, obs_y, obs_r2, geo, cell_start, cell_items):
+        return nx, ny, heading, avoiding, avoid_dir, d
+    # Stuck — force turn
+    return px, py, heading + avoid_dir * 0.5, avoiding, avoid_dir, 0.0
+
+
+def _loiter_step(cx, cy, r, angle, revs, spd, dt):
+    """
+    One loiter tick: advance around the circle at constant speed
+
+    Returns (px, py, heading, angle, revs)
+    """
+    w = spd / r
+    angle += w * dt
+    revs += w * dt / (2 * math.pi)
+    px = cx + r * math.cos(angle)
+    py = cy + r * math.sin(angle)
+    return px, py, _wrap_angle(angle + math.pi / 2), angle, revs
+
+
+def _mark_disk(covered, free, cx, cy, r, new_x, new_y):
+    """
+    Mark the free cells within r cells of (cx, cy) as covered in one pass
+
+    The newly covered cells go to new_x/new_y in row-major order; returns
+    how many there were
+    """
+    rows, cols = covered.shape
+    r2 = r * r
+    n = 0
+    for y in range(max(cy - r, 0), min(cy + r + 1, rows)):
+        dy2 = (y - cy) * (y - cy)
+        for x in range(max(cx - r, 0), min(cx + r + 1, cols)):
+            if (x - cx) * (x - cx) + dy2 <= r2 and free[y, x] and not covered[y, x]:
+                covered[y, x] = True
+                new_x[n] = x
+                new_y[n] = y
+                n += 1
+    return n
+
+
+if njit is not None:
+    _wrap_angle = njit(cache=True)(_wrap_angle)
+    _point_clear = njit(cache=True)(_point_clear)
+    _first_near = njit(cache=True)(_first_near)
+    _flight_step = njit(cache=True)(_flight_step)
+    _loiter_step = njit(cache=True)(_loiter_step)
+    _mark_disk = njit(cache=True)(_mark_disk)
+else:
+    _wrap_angle = normalize_angle
+
+
+@functools.lru_cache(maxsize=None)
+def _trail_runs(n: int) -> Tuple[Tuple[Tuple[int, int, int], int, int], ...]:
+    """
+    (color, first, last) point ranges for drawing an n-point trail
+
+    Segment i (ending at point i) fades to COLORS['trail'] * i / n; after
+    truncation neighbouring segments often share a color, so each run of
+    them is one polyline
+    """
+    if n < 2:
+        return ()
+    colors = (np.array(COLORS['trail']) * (np.arange(1, n) / n)[:, None]).astype(int)
+    cuts = np.flatnonzero((colors[1:] != colors[:-1]).any(axis=1)) + 1
+    bounds = [0, *cuts.tolist(), n - 1]
+    return tuple((tuple(colors[a].tolist()), a, b) for a, b in zip(bounds, bounds[1:]))
+
+
 class SuparnaVisualizer:
     """Full integrated visualization using real planning algorithms"""
 
@@ -68,10 +295,18 @@ class SuparnaVisualizer:
         self.oy = 15
 
         self._setup()
+        self._render_static_text()
+        self._render_panel_background()
+        # Readouts change far slower than the frame rate, so most frames
+        # re-render a string that was rendered the frame before
+        self._render_text = functools.lru_cache(maxsize=256)(self._render_text_uncached)
 
         self.speed_mult = 2.0
         self.paused = False
 
+        # Guards simulation state shared by the sim thread and the renderer
+        self._lock = threading.Lock()
+
     # ── Setup ────────────────────────────────────────────────────────────────
 
     def _setup(self):
@@ -94,6 +329,7 @@ class SuparnaVisualizer:
             obstacle_margin=20.0,
             no_fly_margin=30.0,
         )
+        self._index_obstacles()
 
         # ── Run coverage planner (Greedy Set Cover) ──
         planner = CoveragePlanner(
@@ -124,16 +360,20 @@ class SuparnaVisualizer:
         self.wp_is_loiter.append(False)
         self.wp_loiter_r.append(0.0)
 
+        self._cache_screen_geometry()
         self._reset_drone()
 
         # Coverage tracking
-        self.total_free = int(np.sum(self.smap.grid == CellType.FREE))
-        self.total_free += int(np.sum(self.smap.grid == CellType.START))
-        self.total_free = max(1, self.total_free)
+        # Cells that count toward coverage; the grid is static after planning
+        self.free_mask = (self.smap.grid == CellType.FREE) | (self.smap.grid == CellType.START)
+        self._disk_cache = {}
+        self._new_cells = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        self.total_free = max(1, int(np.count_nonzero(self.free_mask)))
 
     def _reset_drone(self):
         """Reset drone state and coverage"""
-        self.pos = Point(self.home.x, self.home.y)
+        # Position as raw floats; `pos` builds a Point on demand
+        self.pos_x, self.pos_y = self.home.x, self.home.y
         self.heading = 0.0
         self.spd = 35.0
         self.turn_rate = 2.5
@@ -149,33 +389,112 @@ class SuparnaVisualizer:
         self.avoiding = False
         self.avoid_dir = 1  # 1=right, -1=left
 
-        self.trail: List[Point] = []
+        # Simulated time not yet consumed by a fixed substep
+        self._sim_acc = 0.0
+        # Where the last coverage scan was taken
+        self._scan_x, self._scan_y = self.pos_x, self.pos_y
+
+        # Trail: ring buffer of the last TRAIL_LEN recorded positions
+        self._trail_buf = np.zeros((TRAIL_LEN, 2), dtype=float)
+        self._trail_head = 0   # Next slot to write
+        self._trail_len = 0
         self.dist = 0.0
         self.battery = 100.0
         self.n_loiters_done = 0
-        self.covered_cells: Set[Tuple[int, int]] = set()
+        self.covered_mask = np.zeros((self.smap.grid_height, self.smap.grid_width), dtype=bool)
+        self.n_covered = 0
         self.smap.coverage_grid[:] = 0.0
 
+        # Background, map area and obstacles composed once; covered cells
+        # are painted in (under the obstacles) as they're marked
+        self._world_layer = pygame.Surface((self.width, self.height)).convert()
+        self._world_layer.fill(COLORS['bg'])
+        pygame.draw.rect(self._world_layer, COLORS['grid_bg'], self._map_rect)
+        self._draw_obstacles(self._world_layer)
+
+        # Screen regions changed since the last present; start with a full one
+        self._dirty: List[pygame.Rect] = []
+        self._prev_dirty: List[pygame.Rect] = []
+        self._full_redraw = True
+        # Set whenever something on screen may have changed; the render loop
+        # skips frames while it is clear (paused or finished)
+        self._needs_redraw = True
+        self._frame_key = None
+        self._loiter_key = None
+        self._panel_key = None
+
     # ── Obstacle avoidance helpers ────────────────────────────────────────────
 
-    def _in_obstacle(self, pos: Point) -> bool:
-        """Check if position is inside any obstacle's safety margin"""
-        for obs in self.smap.obstacles:
-            if pos.distance_to(obs.center) < obs.radius + self.smap.obstacle_margin + 10:
-                return True
-        return False
-
-    def _check_ahead(self, heading: float, dist: float = 50.0) -> bool:
-        """Check if path ahead is clear of obstacles"""
-        test = Point(
-            self.pos.x + dist * math.cos(heading),
-            self.pos.y + dist * math.sin(heading),
-        )
-        return not self._in_obstacle(test)
+    def _index_obstacles(self):
+        """Cache obstacle centers and squared avoidance radii, and grid them"""
+        # One array per field (structure of arrays)
+        obstacles = self.smap.obstacles
+        self._obs_cx = np.array([o.center.x for o in obstacles], dtype=float)
+        self._obs_cy = np.array([o.center.y for o in obstacles], dtype=float)
+        self._obs_r = np.array([o.radius for o in obstacles], dtype=float)
+        self._obs_r_eff2 = (self._obs_r + self.smap.obstacle_margin + 10) ** 2
+
+        # Uniform grid over the obstacles' bounding boxes, one cell per
+        # largest avoidance radius, so a point query only tests the few
+        # obstacles sharing its cell
+        cx, cy = self._obs_cx, self._obs_cy
+        reach = np.sqrt(self._obs_r_eff2)
+        if len(reach):
+            cell = max(float(reach.max()), 1.0)
+            x0 = float((cx - reach).min())
+            y0 = float((cy - reach).min())
+            cols = int((float((cx + reach).max()) - x0) / cell) + 1
+            rows = int((float((cy + reach).max()) - y0) / cell) + 1
+        else:
+            cell, x0, y0, cols, rows = 1.0, 0.0, 0.0, 0, 0
+        cells = [[] for _ in range(cols * rows)]
+        for i, (x, y, r) in enumerate(zip(cx.tolist(), cy.tolist(), reach.tolist())):
+            for gy in range(int((y - r - y0) / cell), int((y + r - y0) / cell) + 1):
+                for gx in range(int((x - r - x0) / cell), int((x + r - x0) / cell) + 1):
+                    cells[gy * cols + gx].append(i)
+        geo = (x0, y0, 1.0 / cell, float(cols), float(rows))
+        cell_start = [0]
+        for members in cells:
+            cell_start.append(cell_start[-1] + len(members))
+        cell_items = [i for members in cells for i in members]
+
+        # The compiled kernel reads the arrays directly; plain Python is
+        # faster on lists of floats
+        if njit is not None:
+            self._obs_index = (cx, cy, self._obs_r_eff2, np.array(geo),
+                               np.array(cell_start, dtype=np.int64),
+                               np.array(cell_items, dtype=np.int64))
+        else:
+            self._obs_index = (cx.tolist(), cy.tolist(), self._obs_r_eff2.tolist(),
+                               geo, cell_start, cell_items)
 
     # ── Drone update ─────────────────────────────────────────────────────────
 
     def _update(self, dt: float):
+        """
+        Advance the simulation by dt in fixed substeps, then scan
+
+        Long frames also scan between substeps, every _SCAN_SPACING meters
+        flown, so coverage has no gaps
+        """
+        self._sim_acc += dt
+        steps = int(self._sim_acc / FIXED_DT)
+        if steps > _MAX_SUBSTEPS:
+            # Too far behind (e.g. after a stall): drop the backlog
+            steps, self._sim_acc = _MAX_SUBSTEPS, 0.0
+        else:
+            self._sim_acc -= steps * FIXED_DT
+        for _ in range(steps):
+            if self.state == 'DONE':
+                break
+            self._step(FIXED_DT)
+            dx = self.pos_x - self._scan_x
+            dy = self.pos_y - self._scan_y
+            if dx * dx + dy * dy > _SCAN_SPACING * _SCAN_SPACING:
+                self._scan()
+        self._scan()
+
+    def _step(self, dt: float):
         if self.state == 'DONE':
             return
         if self.state == 'LOITER':
@@ -187,71 +506,24 @@ class SuparnaVisualizer:
 
         target = self.waypoints[self.wp_idx]
 
-        # Target heading
-        th = math.atan2(target.y - self.pos.y, target.x - self.pos.x)
-
-        # ── Obstacle avoidance (edge-following) ──
-        if self._check_ahead(th):
-            # Path clear — fly direct
-            self.avoiding = False
-            desired = th
-        else:
-            # Path blocked — edge-follow around obstacle
-            if not self.avoiding:
-                self.avoiding = True
-                # Pick avoidance direction: turn away from nearest obstacle
-                for obs in self.smap.obstacles:
-                    if self.pos.distance_to(obs.center) < 200:
-                        to_obs = math.atan2(obs.center.y - self.pos.y,
-                                            obs.center.x - self.pos.x)
-                        diff = normalize_angle(th - to_obs)
-                        self.avoid_dir = 1 if diff > 0 else -1
-                        break
-
-            desired = self.heading + self.avoid_dir * 0.8
-
-            # Try to curve back toward target
-            for test_a in [0.3, 0.5, 0.7]:
-                test_h = normalize_angle(self.heading + self.avoid_dir * test_a)
-                if self._check_ahead(test_h, 60):
-                    gap = abs(normalize_angle(th - test_h))
-                    if gap < 1.5:
-                        desired = test_h
-                        break
-
-        # Smooth turning
-        err = normalize_angle(desired - self.heading)
-        mt = self.turn_rate * dt
-        if abs(err) > mt:
-            self.heading += mt if err > 0 else -mt
-        else:
-            self.heading = desired
-        self.heading = normalize_angle(self.heading)
-
-        # Move forward (only if clear)
-        d = self.spd * dt
-        new_pos = Point(
-            self.pos.x + d * math.cos(self.heading),
-            self.pos.y + d * math.sin(self.heading),
+        # Avoidance, turning and the guarded move run in a compiled kernel
+        (self.pos_x, self.pos_y, self.heading,
+         self.avoiding, self.avoid_dir, moved) = _flight_step(
+            self.pos_x, self.pos_y, self.heading, target.x, target.y,
+            *self._obs_index, self.avoiding, self.avoid_dir,
+            self.spd, self.turn_rate, dt,
         )
-        if not self._in_obstacle(new_pos):
-            self.pos = new_pos
-            self.dist += d
-        else:
-            # Stuck — force turn
-            self.heading += self.avoid_dir * 0.5
+        self.dist += moved
 
         self.battery -= 0.08 * dt
 
         # Trail
-        if not self.trail or self.pos.distance_to(self.trail[-1]) > 4:
-            self.trail.append(Point(self.pos.x, self.pos.y))
-
-        # Coverage scan while flying
-        self._mark_coverage(self.pos, 4)
+        self._push_trail(4)
 
         # Check waypoint reached
-        if self.pos.distance_to(target) < 20:
+        tx = target.x - self.pos_x
+        ty = target.y - self.pos_y
+        if tx * tx + ty * ty < 20 * 20:
             self.avoiding = False
             if self.wp_is_loiter[self.wp_idx]:
                 self.loiter_r = self.wp_loiter_r[self.wp_idx]
@@ -270,25 +542,16 @@ class SuparnaVisualizer:
             self.state = 'FLY'
             return
 
-        w = self.spd / self.loiter_r
-        self.loiter_angle += w * dt
-        self.loiter_revs += w * dt / (2 * math.pi)
-
-        self.pos = Point(
-            self.loiter_center.x + self.loiter_r * math.cos(self.loiter_angle),
-            self.loiter_center.y + self.loiter_r * math.sin(self.loiter_angle),
+        (self.pos_x, self.pos_y, self.heading,
+         self.loiter_angle, self.loiter_revs) = _loiter_step(
+            self.loiter_center.x, self.loiter_center.y, self.loiter_r,
+            self.loiter_angle, self.loiter_revs, self.spd, dt,
         )
-        self.heading = normalize_angle(self.loiter_angle + math.pi / 2)
 
         self.dist += self.spd * dt
         self.battery -= 0.05 * dt  # Loiter is more energy-efficient
 
-        if not self.trail or self.pos.distance_to(self.trail[-1]) > 3:
-            self.trail.append(Point(self.pos.x, self.pos.y))
-
-        # Wider coverage scan during loiter
-        r_cells = int(self.loiter_r / self.smap.resolution) + 2
-        self._mark_coverage(self.loiter_center, r_cells)
+        self._push_trail(3)
 
         if self.loiter_revs >= 1.0:
             self.n_loiters_done += 1
@@ -296,23 +559,127 @@ class SuparnaVisualizer:
             self.loiter_center = None
             self.wp_idx += 1
 
-    def _mark_coverage(self, center: Point, radius_cells: int):
-        cell = self.smap.point_to_cell(center)
-        if cell is None:
+    def _scan(self):
+        """Mark the area under the drone as covered"""
+        self._scan_x, self._scan_y = self.pos_x, self.pos_y
+        if self.loiter_center is not None:
+            # Wider coverage scan during loiter
+            r_cells = int(self.loiter_r / self.smap.resolution) + 2
+            self._mark_coverage(self.loiter_center.x, self.loiter_center.y, r_cells)
+        elif self.state == 'FLY':
+            self._mark_coverage(self.pos_x, self.pos_y, _SCAN_CELLS)
+
+    def _push_trail(self, min_dist: float):
+        """Record the current position if it moved more than min_dist"""
+        if self._trail_len:
+            lx, ly = self._trail_buf[self._trail_head - 1]
+            dx = self.pos_x - lx
+            dy = self.pos_y - ly
+            if dx * dx + dy * dy <= min_dist * min_dist:
+                return
+        self._trail_buf[self._trail_head] = (self.pos_x, self.pos_y)
+        self._trail_head = (self._trail_head + 1) % TRAIL_LEN
+        self._trail_len = min(self._trail_len + 1, TRAIL_LEN)
+
+    @property
+    def trail(self) -> np.ndarray:
+        """Recorded trail, oldest first, as an (n, 2) array"""
+        if self._trail_len < TRAIL_LEN:
+            return self._trail_buf[:self._trail_len]
+        # Unwrap the ring: two slices beat np.roll's general shift machinery
+        head = self._trail_head
+        return np.concatenate((self._trail_buf[head:], self._trail_buf[:head]))
+
+    def _disk_stamp(self, radius_cells: int) -> np.ndarray:
+        """Boolean (2r+1, 2r+1) disk of the cells within radius_cells, cached"""
+        stamp = self._disk_cache.get(radius_cells)
+        if stamp is None:
+            r = np.arange(-radius_cells, radius_cells + 1)
+            stamp = r[:, None] ** 2 + r[None, :] ** 2 <= radius_cells * radius_cells
+            self._disk_cache[radius_cells] = stamp
+        return stamp
+
+    def _mark_coverage(self, x: float, y: float, radius_cells: int):
+        # Same truncation as SurveillanceMap.point_to_cell
+        cx = int(x / self.smap.resolution)
+        cy = int(y / self.smap.resolution)
+        r = radius_cells
+        if njit is not None:
+            # Compiled: stamp, mask and record in one loop, no temporaries
+            if len(self._new_cells[0]) < (2 * r + 1) ** 2:
+                self._new_cells = (np.empty((2 * r + 1) ** 2, dtype=np.int64),
+                                   np.empty((2 * r + 1) ** 2, dtype=np.int64))
+            new_x, new_y = self._new_cells
+            n = _mark_disk(self.covered_mask, self.free_mask, cx, cy, r, new_x, new_y)
+            if n:
+                self.n_covered += n
+                self._paint_coverage(new_x[:n], new_y[:n])
+            return
+        # Clip the disk's bounding square to the grid; everything below
+        # works on these rectangular windows, with no index arrays
+        x0, x1 = max(cx - r, 0), min(cx + r + 1, self.smap.grid_width)
+        y0, y1 = max(cy - r, 0), min(cy + r + 1, self.smap.grid_height)
+        if x0 >= x1 or y0 >= y1:
             return
-        cx, cy = cell
-        r2 = radius_cells * radius_cells
-        for dx in range(-radius_cells, radius_cells + 1):
-            for dy in range(-radius_cells, radius_cells + 1):
-                if dx * dx + dy * dy <= r2:
-                    nx, ny = cx + dx, cy + dy
-                    if 0 <= nx < self.smap.grid_width and 0 <= ny < self.smap.grid_height:
-                        if self.smap.grid[ny, nx] in (CellType.FREE, CellType.START):
-                            self.covered_cells.add((nx, ny))
+        disk = self._disk_stamp(r)[y0 - cy + r:y1 - cy + r, x0 - cx + r:x1 - cx + r]
+        covered = self.covered_mask[y0:y1, x0:x1]
+        new = disk & self.free_mask[y0:y1, x0:x1] & ~covered
+        if new.any():
+            covered |= new
+            ny, nx = np.nonzero(new)
+            self.n_covered += len(nx)
+            self._paint_coverage(nx + x0, ny + y0)
+
+    def _paint_coverage(self, nx: np.ndarray, ny: np.ndarray):
+        """Draw newly covered cells (column/row arrays) onto the world layer"""
+        layer = self._world_layer
+        xs, ys = self._cell_sx[nx], self._cell_sy[ny]
+        cs = self._cell_px
+        if len(xs) < _BULK_PAINT_MIN:
+            color = COLORS['covered']
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                pygame.draw.rect(layer, color, (x, y, cs, cs))
+        else:
+            # Whole loiter disks at once: one array store instead of a draw
+            # call per cell
+            block = np.arange(cs)
+            pixels = pygame.surfarray.pixels2d(layer)
+            pixels[(xs[:, None] + block)[:, :, None],
+                   (ys[:, None] + block)[:, None, :]] = layer.map_rgb(COLORS['covered'])
+            del pixels  # Unlocks the surface
+        x0, y0 = int(xs.min()), int(ys.min())
+        area = pygame.Rect(x0, y0, int(xs.max()) - x0 + cs, int(ys.max()) - y0 + cs)
+        # Obstacles sit above the coverage cells
+        self._draw_obstacles(layer, area)
+        self._dirty.append(area)
+
+    def _draw_obstacles(self, surf: pygame.Surface, area: Optional[pygame.Rect] = None):
+        """Draw obstacle glows and bodies onto surf, only within area if given"""
+        surf.set_clip(area)
+        for pos, r, mr_r in self._obstacles_s:
+            if area is None or area.colliderect(
+                    (pos[0] - mr_r, pos[1] - mr_r, 2 * mr_r + 1, 2 * mr_r + 1)):
+                pygame.draw.circle(surf, COLORS['obstacle_glow'], pos, mr_r)
+                pygame.draw.circle(surf, COLORS['obstacle'], pos, r)
+        surf.set_clip(None)
 
     @property
     def coverage_pct(self) -> float:
-        return 100.0 * len(self.covered_cells) / self.total_free
+        return 100.0 * self.n_covered / self.total_free
+
+    @property
+    def pos(self) -> Point:
+        return Point(self.pos_x, self.pos_y)
+
+    @pos.setter
+    def pos(self, p: Point):
+        self.pos_x, self.pos_y = p.x, p.y
+
+    @property
+    def covered_cells(self) -> Set[Tuple[int, int]]:
+        """Covered cells as (x, y) tuples (built from covered_mask on demand)"""
+        ys, xs = np.nonzero(self.covered_mask)
+        return set(zip(xs.tolist(), ys.tolist()))
 
     # ── Coordinate transform ─────────────────────────────────────────────────
 
@@ -323,134 +690,281 @@ class SuparnaVisualizer:
             int(self.height - self.oy - p.y * self.scale),
         )
 
+    def w2s_batch(self, xy: np.ndarray) -> np.ndarray:
+        """w2s for an (N, 2) array of world points; returns int32 (N, 2) pixels"""
+        out = np.empty(xy.shape, dtype=np.int32)
+        out[:, 0] = self.ox + xy[:, 0] * self.scale
+        out[:, 1] = self.height - self.oy - xy[:, 1] * self.scale
+        return out
+
+    def _cache_screen_geometry(self):
+        """Screen positions/radii of static mission geometry (computed once)"""
+        self._home_s = self.w2s(self.home)
+        self._obstacles_s = [
+            (self.w2s(obs.center), int(obs.radius * self.scale),
+             int((obs.radius + self.smap.obstacle_margin) * self.scale))
+            for obs in self.smap.obstacles
+        ]
+        self._loiters_s = [(self.w2s(c), int(r * self.scale))
+                           for c, r in self.loiter_targets]
+        self._path_s = ([self._home_s] + [p for p, _ in self._loiters_s]
+                        + [self._home_s])
+        self._path_dashes = [self._dash_segments(p1, p2)
+                             for p1, p2 in zip(self._path_s, self._path_s[1:])]
+
+        # Translucent scan-radius glow under the drone, one per drone color
+        self._scan_r = scan_r = int(40 * self.scale)
+        self._glow = {}
+        for color in (COLORS['drone'], COLORS['drone_loiter']):
+            glow = pygame.Surface((scan_r * 2, scan_r * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (*color, 25), (scan_r, scan_r), scan_r)
+            self._glow[color] = glow.convert_alpha()
+
+        self._map_rect = (self.ox, self.oy,
+                          int(self.world_w * self.scale), int(self.world_h * self.scale))
+
+        # Grid cell (cx, cy) is the cs-pixel square at (_cell_sx[cx], _cell_sy[cy])
+        res, scale = self.smap.resolution, self.scale
+        self._cell_px = max(2, int(res * scale))
+        self._cell_sx = (self.ox + np.arange(self.smap.grid_width) * res * scale
+                         ).astype(int)
+        self._cell_sy = (self.height - self.oy
+                         - (np.arange(self.smap.grid_height) + 1) * res * scale
+                         ).astype(int)
+
+    @staticmethod
+    def _dash_segments(p1: Tuple[int, int], p2: Tuple[int, int]
+                       ) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Endpoints of the ~10 px dashes drawn along a future path leg"""
+        dx, dy = p2[0] - p1[0], p2[1] - p1[1]
+        length = math.sqrt(dx * dx + dy * dy)
+        if length < 2:
+            return []
+        steps = max(1, int(length / 10))
+        dashes = []
+        for s in range(0, steps, 2):
+            t1 = s / steps
+            t2 = min((s + 1) / steps, 1.0)
+            dashes.append(((int(p1[0] + dx * t1), int(p1[1] + dy * t1)),
+                           (int(p1[0] + dx * t2), int(p1[1] + dy * t2))))
+        return dashes
+
+    def _render_static_text(self):
+        """Pre-render every label whose text and color never change"""
+        render = self._render_text_uncached
+        small, tiny = self.font_small, self.font_tiny
+        self._txt_home = render(small, "HOME", COLORS['home'])
+        self._txt_check = render(small, "✓", COLORS['loiter_done'])
+        n = len(self.loiter_targets)
+        self._txt_loiter_num = {
+            state: [render(tiny, str(i + 1), COLORS[state]) for i in range(n)]
+            for state in ('loiter_done', 'loiter_pending')
+        }
+
+        # Panel headings and fixed lists
+        self._txt_title = render(self.font_title, "SUPARNA", COLORS['text_accent'])
+        self._txt_subtitle = render(tiny, "Swift-Inspired Surveillance", COLORS['text_dim'])
+        self._txt_coverage = render(small, "COVERAGE", COLORS['text_dim'])
+        self._txt_battery = render(small, "BATTERY", COLORS['text_dim'])
+        self._txt_mission = render(self.font, "MISSION", COLORS['text'])
+        self._txt_algorithms = render(self.font, "ALGORITHMS", COLORS['text'])
+        self._txt_algo_items = [
+            render(tiny, f"• {algo}", COLORS['text_dim'])
+            for algo in ["Greedy Set Cover", "Dubins Curves", "A* Pathfinder",
+                         "Bug2 Avoidance", "Loiter Patterns"]
+        ]
+        self._txt_controls = render(self.font, "CONTROLS", COLORS['text'])
+        self._txt_control_items = [
+            render(tiny, c_txt, COLORS['text_dim'])
+            for c_txt in ["SPACE  Pause", "+/-    Speed", "R      Reset", "ESC    Exit"]
+        ]
+
+        # Checklist rows in each of their states
+        self._txt_checklist = [
+            {
+                'done': render(small, f"✓ Loiter {i + 1}", COLORS['loiter_done']),
+                'active': render(small, f"▶ Loiter {i + 1}", COLORS['loiter_active']),
+                'pending': render(small, f"○ Loiter {i + 1}", COLORS['text_dim']),
+            }
+            for i in range(n)
+        ]
+        self._txt_return = {
+            True: render(small, "✓ Return HOME", COLORS['home']),
+            False: render(small, "○ Return HOME", COLORS['text_dim']),
+        }
+
+    def _render_panel_background(self):
+        """Draw the fixed parts of the side panel once and record widget rows"""
+        surf = pygame.Surface((self.panel_w, self.height)).convert()
+        surf.fill(COLORS['panel_bg'])
+        pygame.draw.line(surf, COLORS['text_dim'], (0, 0), (0, self.height), 1)
+
+        x = 15
+        y = 20
+        bw = self.panel_w - 35  # bar width
+        rows = {}
+
+        surf.blit(self._txt_title, (x, y)); y += 26
+        surf.blit(self._txt_subtitle, (x, y)); y += 30
+        rows['status'] = y; y += 32
+
+        surf.blit(self._txt_coverage, (x, y)); y += 18
+        pygame.draw.rect(surf, COLORS['bar_bg'], (x, y, bw, 14))
+        rows['coverage'] = y; y += 28
+
+        surf.blit(self._txt_battery, (x, y)); y += 18
+        pygame.draw.rect(surf, COLORS['bar_bg'], (x, y, bw, 14))
+        rows['battery'] = y; y += 28
+
+        rows['stats'] = y; y += 3 * 22 + 10
+
+        surf.blit(self._txt_mission, (x, y)); y += 24
+        rows['checklist'] = y; y += 20 * len(self._txt_checklist)
+        rows['return'] = y; y += 30
+
+        surf.blit(self._txt_algorithms, (x, y)); y += 22
+        for t in self._txt_algo_items:
+            surf.blit(t, (x, y)); y += 16
+        y += 12
+
+        surf.blit(self._txt_controls, (x, y)); y += 22
+        for t in self._txt_control_items:
+            surf.blit(t, (x, y)); y += 16
+
+        self._panel_surf = surf
+        # The background plus the current readouts, redrawn when they change
+        self._panel_frame = surf.copy()
+        self._panel_rows = rows
+        # Everything between the status line and the return row can change
+        self._panel_dirty = pygame.Rect(self.width - self.panel_w, rows['status'],
+                                        self.panel_w, rows['return'] + 30 - rows['status'])
+
+    def _render_text_uncached(self, font: pygame.font.Font, text: str,
+                              color: Tuple[int, int, int]) -> pygame.Surface:
+        # In the display's pixel format, so blits skip per-pixel conversion
+        return font.render(text, True, color).convert_alpha()
+
     # ── Drawing ──────────────────────────────────────────────────────────────
 
     def draw_map(self):
-        # Map background
-        mr = (self.ox, self.oy,
-              int(self.world_w * self.scale), int(self.world_h * self.scale))
-        pygame.draw.rect(self.screen, COLORS['grid_bg'], mr)
-
-        # Coverage cells (green)
-        cs = max(2, int(self.smap.resolution * self.scale))
-        for (cx, cy) in self.covered_cells:
-            sx = int(self.ox + cx * self.smap.resolution * self.scale)
-            sy = int(self.height - self.oy - (cy + 1) * self.smap.resolution * self.scale)
-            pygame.draw.rect(self.screen, COLORS['covered'], (sx, sy, cs, cs))
-
-        # Obstacles
-        for obs in self.smap.obstacles:
-            pos = self.w2s(obs.center)
-            r = int(obs.radius * self.scale)
-            mr_r = int((obs.radius + self.smap.obstacle_margin) * self.scale)
-            pygame.draw.circle(self.screen, COLORS['obstacle_glow'], pos, mr_r)
-            pygame.draw.circle(self.screen, COLORS['obstacle'], pos, r)
+        # Background, map area, coverage cells and obstacles in one blit
+        self.screen.blit(self._world_layer, (0, 0))
+
+    def _static_loiters(self) -> Tuple[Tuple[list, list], Tuple[list, list]]:
+        """
+        Rings (color, center, radius, width) and label blits of the loiters
+        drawn below and above the active one, rebuilt only when a loiter
+        starts or ends
+        """
+        active = self.n_loiters_done if self.state == 'LOITER' else -1
+        key = (self.n_loiters_done, active)
+        if key != self._loiter_key:
+            self._loiter_key = key
+            below, above = ([], []), ([], [])
+            for i, (pos, r) in enumerate(self._loiters_s):
+                if i == active:
+                    continue
+                # Targets overlap, so later ones stay on top of the active arc
+                rings, labels = above if 0 <= active < i else below
+                if i < self.n_loiters_done:
+                    # Completed
+                    rings.append((COLORS['loiter_done'], pos, r, 2))
+                    labels.append((self._txt_check, (pos[0] - 5, pos[1] - 8)))
+                    labels.append((self._txt_loiter_num['loiter_done'][i],
+                                   (pos[0] + r + 3, pos[1] - 6)))
+                else:
+                    # Pending
+                    rings.append((COLORS['loiter_pending'], pos, r, 1))
+                    labels.append((self._txt_loiter_num['loiter_pending'][i],
+                                   (pos[0] + r + 3, pos[1] - 6)))
+            self._loiter_static = (below, above)
+        return self._loiter_static
+
+    def _draw_loiter_group(self, rings: list, labels: list):
+        """Draw one group of cached loiter rings and labels"""
+        for color, pos, r, width in rings:
+            pygame.draw.circle(self.screen, color, pos, r, width)
+        self.screen.blits(labels, doreturn=False)
 
     def draw_loiters(self):
         """Draw loiter target circles with status"""
-        for i, (center, radius) in enumerate(self.loiter_targets):
-            pos = self.w2s(center)
-            r = int(radius * self.scale)
-
-            if i < self.n_loiters_done:
-                # Completed
-                pygame.draw.circle(self.screen, COLORS['loiter_done'], pos, r, 2)
-                lbl = self.font_small.render("✓", True, COLORS['loiter_done'])
-                self.screen.blit(lbl, (pos[0] - 5, pos[1] - 8))
-            elif i == self.n_loiters_done and self.state == 'LOITER':
-                # Active — draw progress arc
-                pygame.draw.circle(self.screen, COLORS['loiter_active'], pos, r, 3)
-                prog = min(self.loiter_revs, 1.0)
-                arc_r = pygame.Rect(pos[0] - r, pos[1] - r, r * 2, r * 2)
-                if prog > 0.01:
-                    pygame.draw.arc(self.screen, COLORS['drone'], arc_r,
-                                    0, prog * 2 * math.pi, 4)
-            else:
-                # Pending
-                pygame.draw.circle(self.screen, COLORS['loiter_pending'], pos, r, 1)
-
-            # Loiter number
-            num = self.font_tiny.render(str(i + 1), True,
-                                        COLORS['loiter_done'] if i < self.n_loiters_done
-                                        else COLORS['loiter_pending'])
-            self.screen.blit(num, (pos[0] + r + 3, pos[1] - 6))
+        below, above = self._static_loiters()
+        self._draw_loiter_group(*below)
+
+        if self.state == 'LOITER' and self.n_loiters_done < len(self._loiters_s):
+            # Active — draw progress arc
+            i = self.n_loiters_done
+            pos, r = self._loiters_s[i]
+            dirty = pygame.draw.circle(self.screen, COLORS['loiter_active'], pos, r, 3)
+            prog = min(self.loiter_revs, 1.0)
+            arc_r = pygame.Rect(pos[0] - r, pos[1] - r, r * 2, r * 2)
+            if prog > 0.01:
+                # The thick arc can reach a pixel past the ring's bounds
+                dirty.union_ip(pygame.draw.arc(self.screen, COLORS['drone'], arc_r,
+                                               0, prog * 2 * math.pi, 4))
+            self._dirty.append(dirty)
+            self.screen.blit(self._txt_loiter_num['loiter_pending'][i],
+                             (pos[0] + r + 3, pos[1] - 6))
+
+        self._draw_loiter_group(*above)
 
     def draw_path(self):
         """Draw planned path lines between waypoints"""
-        pts = [self.home] + [c for c, _ in self.loiter_targets] + [self.home]
-        for i in range(len(pts) - 1):
-            p1, p2 = self.w2s(pts[i]), self.w2s(pts[i + 1])
-            done = i < self.wp_idx
-            if done:
-                pygame.draw.line(self.screen, COLORS['path_line'], p1, p2, 2)
-            else:
-                # Dashed line for future path
-                dx, dy = p2[0] - p1[0], p2[1] - p1[1]
-                length = math.sqrt(dx * dx + dy * dy)
-                if length < 2:
-                    continue
-                steps = max(1, int(length / 10))
-                for s in range(0, steps, 2):
-                    t1 = s / steps
-                    t2 = min((s + 1) / steps, 1.0)
-                    a = (int(p1[0] + dx * t1), int(p1[1] + dy * t1))
-                    b = (int(p1[0] + dx * t2), int(p1[1] + dy * t2))
-                    pygame.draw.line(self.screen, COLORS['path_line'], a, b, 1)
+        pts = self._path_s
+        # Completed legs form one contiguous polyline
+        n_done = min(self.wp_idx, len(pts) - 1)
+        if n_done > 0:
+            pygame.draw.lines(self.screen, COLORS['path_line'], False,
+                              pts[:n_done + 1], 2)
+
+        # Dashed lines for future path
+        color = COLORS['path_line']
+        for leg in self._path_dashes[n_done:]:
+            for a, b in leg:
+                pygame.draw.line(self.screen, color, a, b, 1)
 
     def draw_drone(self):
-        # Trail
-        trail_pts = [self.w2s(p) for p in self.trail[-500:]]
-        for i in range(1, len(trail_pts)):
-            alpha = i / len(trail_pts)
-            c = tuple(int(v * alpha) for v in COLORS['trail'])
-            pygame.draw.line(self.screen, c, trail_pts[i - 1], trail_pts[i], 2)
+        # Trail (screen transform done for all points at once)
+        s = self.w2s_batch(self.trail)
+        sx, sy = s[:, 0], s[:, 1]
+        trail_pts = list(map(tuple, s.tolist()))
+        # Trail colors fade by index, so the whole span changes per push;
+        # bound it in short runs rather than one box around a long sweep
+        for k in range(0, len(trail_pts) - 1, _TRAIL_DIRTY_RUN):
+            rx, ry = sx[k:k + _TRAIL_DIRTY_RUN + 1], sy[k:k + _TRAIL_DIRTY_RUN + 1]
+            x0, y0 = int(rx.min()), int(ry.min())
+            self._dirty.append(pygame.Rect(x0 - 2, y0 - 2, int(rx.max()) - x0 + 5,
+                                           int(ry.max()) - y0 + 5))
+        for c, first, last in _trail_runs(len(trail_pts)):
+            pygame.draw.lines(self.screen, c, False, trail_pts[first:last + 1], 2)
 
         # Drone body
-        pos = self.w2s(self.pos)
+        pos = (int(self.ox + self.pos_x * self.scale),
+               int(self.height - self.oy - self.pos_y * self.scale))
         color = COLORS['drone_loiter'] if self.state == 'LOITER' else COLORS['drone']
-        a = -self.heading  # Screen y is inverted
-        sz = 12
-        pts = [
-            (pos[0] + int(sz * 1.8 * math.cos(a)),
-             pos[1] + int(sz * 1.8 * math.sin(a))),
-            (pos[0] + int(sz * math.cos(a + 2.3)),
-             pos[1] + int(sz * math.sin(a + 2.3))),
-            (pos[0] + int(sz * math.cos(a - 2.3)),
-             pos[1] + int(sz * math.sin(a - 2.3))),
-        ]
+        # Rotate the body outline by the heading; screen y is inverted
+        c, s = math.cos(self.heading), -math.sin(self.heading)
+        pts = [(pos[0] + int(bx * c - by * s), pos[1] + int(bx * s + by * c))
+               for bx, by in _DRONE_SHAPE]
         pygame.draw.polygon(self.screen, color, pts)
         pygame.draw.polygon(self.screen, (255, 255, 255), pts, 2)
 
         # Scan radius glow
-        scan_r = int(40 * self.scale)
-        glow = pygame.Surface((scan_r * 2, scan_r * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (*color, 25), (scan_r, scan_r), scan_r)
-        self.screen.blit(glow, (pos[0] - scan_r, pos[1] - scan_r))
+        scan_r = self._scan_r
+        self.screen.blit(self._glow[color], (pos[0] - scan_r, pos[1] - scan_r))
+        reach = max(scan_r, int(_DRONE_SHAPE[0][0]) + 2) + 1
+        self._dirty.append(pygame.Rect(pos[0] - reach, pos[1] - reach,
+                                       2 * reach + 1, 2 * reach + 1))
 
     def draw_home(self):
-        pos = self.w2s(self.home)
+        pos = self._home_s
         pygame.draw.circle(self.screen, COLORS['home'], pos, 14, 3)
         pygame.draw.circle(self.screen, COLORS['home'], pos, 5)
-        lbl = self.font_small.render("HOME", True, COLORS['home'])
-        self.screen.blit(lbl, (pos[0] - 18, pos[1] + 16))
+        self.screen.blit(self._txt_home, (pos[0] - 18, pos[1] + 16))
 
     def draw_panel(self):
-        px = self.width - self.panel_w
-        pygame.draw.rect(self.screen, COLORS['panel_bg'],
-                         (px, 0, self.panel_w, self.height))
-        pygame.draw.line(self.screen, COLORS['text_dim'],
-                         (px, 0), (px, self.height), 1)
-
-        x = px + 15
-        y = 20
         bw = self.panel_w - 35  # bar width
 
-        # Title
-        t = self.font_title.render("SUPARNA", True, COLORS['text_accent'])
-        self.screen.blit(t, (x, y)); y += 26
-        t = self.font_tiny.render("Swift-Inspired Surveillance", True, COLORS['text_dim'])
-        self.screen.blit(t, (x, y)); y += 30
-
         # Status
         if self.state == 'DONE':
             status = "MISSION COMPLETE"
@@ -464,111 +978,162 @@ class SuparnaVisualizer:
         else:
             status = f"EN ROUTE → L{self.n_loiters_done + 1}"
             sc = COLORS['drone']
-        t = self.font.render(status, True, sc)
-        self.screen.blit(t, (x, y)); y += 32
 
-        # Coverage bar
-        t = self.font_small.render("COVERAGE", True, COLORS['text_dim'])
-        self.screen.blit(t, (x, y)); y += 18
         cov = self.coverage_pct
-        pygame.draw.rect(self.screen, COLORS['bar_bg'], (x, y, bw, 14))
         cov_color = COLORS['bar_good'] if cov > 80 else COLORS['bar_warn']
-        pygame.draw.rect(self.screen, cov_color,
-                         (x, y, int(bw * min(cov, 100) / 100), 14))
-        t = self.font_tiny.render(f"{cov:.1f}%", True, COLORS['text'])
-        self.screen.blit(t, (x + bw // 2 - 14, y + 1)); y += 28
-
-        # Battery bar
-        t = self.font_small.render("BATTERY", True, COLORS['text_dim'])
-        self.screen.blit(t, (x, y)); y += 18
         bat = max(0, self.battery)
         bat_c = COLORS['bar_danger'] if bat < 20 else (
             COLORS['bar_warn'] if bat < 40 else COLORS['bar_good'])
-        pygame.draw.rect(self.screen, COLORS['bar_bg'], (x, y, bw, 14))
-        pygame.draw.rect(self.screen, bat_c,
-                         (x, y, int(bw * min(bat, 100) / 100), 14))
-        t = self.font_tiny.render(f"{bat:.0f}%", True, COLORS['text'])
-        self.screen.blit(t, (x + bw // 2 - 14, y + 1)); y += 28
+
+        # Everything the panel shows; it is only redrawn when this changes
+        key = (status, sc,
+               f"{cov:.1f}%", cov_color, int(bw * min(cov, 100) / 100),
+               f"{bat:.0f}%", bat_c, int(bw * min(bat, 100) / 100),
+               f"{self.dist:.0f}m", f"{self.speed_mult:.1f}x",
+               self.n_loiters_done, self.state)
+        if key != self._panel_key:
+            self._panel_key = key
+            self._redraw_panel(*key)
+            self._dirty.append(self._panel_dirty)
+        self.screen.blit(self._panel_frame, (self.width - self.panel_w, 0))
+
+    def _redraw_panel(self, status, sc, cov_txt, cov_color, cov_w,
+                      bat_txt, bat_c, bat_w, dist_txt, speed_txt,
+                      n_done, state):
+        """Compose the panel background and the given readouts onto _panel_frame"""
+        surf = self._panel_frame
+        surf.blit(self._panel_surf, (0, 0))
+
+        rows = self._panel_rows
+        x = 15
+        bw = self.panel_w - 35  # bar width
+
+        t = self._render_text(self.font, status, sc)
+        surf.blit(t, (x, rows['status']))
+
+        # Coverage bar
+        y = rows['coverage']
+        pygame.draw.rect(surf, cov_color, (x, y, cov_w, 14))
+        t = self._render_text(self.font_tiny, cov_txt, COLORS['text'])
+        surf.blit(t, (x + bw // 2 - 14, y + 1))
+
+        # Battery bar
+        y = rows['battery']
+        pygame.draw.rect(surf, bat_c, (x, y, bat_w, 14))
+        t = self._render_text(self.font_tiny, bat_txt, COLORS['text'])
+        surf.blit(t, (x + bw // 2 - 14, y + 1))
 
         # Stats
+        y = rows['stats']
         for label, val in [
-            ("Distance", f"{self.dist:.0f}m"),
-            ("Speed", f"{self.speed_mult:.1f}x"),
-            ("Loiters", f"{self.n_loiters_done}/{len(self.loiter_targets)}"),
+            ("Distance", dist_txt),
+            ("Speed", speed_txt),
+            ("Loiters", f"{n_done}/{len(self.loiter_targets)}"),
         ]:
-            t = self.font_small.render(f"{label}: {val}", True, COLORS['text'])
-            self.screen.blit(t, (x, y)); y += 22
-        y += 10
+            t = self._render_text(self.font_small, f"{label}: {val}", COLORS['text'])
+            surf.blit(t, (x, y)); y += 22
 
         # Loiter checklist
-        t = self.font.render("MISSION", True, COLORS['text'])
-        self.screen.blit(t, (x, y)); y += 24
-        for i in range(len(self.loiter_targets)):
-            done = i < self.n_loiters_done
-            active = i == self.n_loiters_done and self.state == 'LOITER'
-            sym = "✓" if done else ("▶" if active else "○")
-            c = COLORS['loiter_done'] if done else (
-                COLORS['loiter_active'] if active else COLORS['text_dim'])
-            t = self.font_small.render(f"{sym} Loiter {i + 1}", True, c)
-            self.screen.blit(t, (x, y)); y += 20
-
-        done_all = self.state == 'DONE'
-        sym = "✓" if done_all else "○"
-        c = COLORS['home'] if done_all else COLORS['text_dim']
-        t = self.font_small.render(f"{sym} Return HOME", True, c)
-        self.screen.blit(t, (x, y)); y += 30
-
-        # Algorithm info
-        t = self.font.render("ALGORITHMS", True, COLORS['text'])
-        self.screen.blit(t, (x, y)); y += 22
-        for algo in ["Greedy Set Cover", "Dubins Curves", "A* Pathfinder",
-                      "Bug2 Avoidance", "Loiter Patterns"]:
-            t = self.font_tiny.render(f"• {algo}", True, COLORS['text_dim'])
-            self.screen.blit(t, (x, y)); y += 16
-        y += 12
+        y = rows['checklist']
+        for i, row in enumerate(self._txt_checklist):
+            if i < n_done:
+                t = row['done']
+            elif i == n_done and state == 'LOITER':
+                t = row['active']
+            else:
+                t = row['pending']
+            surf.blit(t, (x, y)); y += 20
+
+        surf.blit(self._txt_return[state == 'DONE'], (x, rows['return']))
 
-        # Controls
-        t = self.font.render("CONTROLS", True, COLORS['text'])
-        self.screen.blit(t, (x, y)); y += 22
-        for c_txt in ["SPACE  Pause", "+/-    Speed", "R      Reset", "ESC    Exit"]:
-            t = self.font_tiny.render(c_txt, True, COLORS['text_dim'])
-            self.screen.blit(t, (x, y)); y += 16
+    def draw_frame(self):
+        """Redraw the whole scene onto the back buffer"""
+        self.draw_map()
+        self.draw_path()
+        self.draw_loiters()
+        self.draw_home()
+        self.draw_drone()
+        self.draw_panel()
 
     # ── Main loop ────────────────────────────────────────────────────────────
 
+    def _take_dirty(self) -> Optional[List[pygame.Rect]]:
+        """Regions changed by the frame just drawn, or None for a full flip"""
+        # Path styling, loiter markers and drone color all key off these
+        key = (self.wp_idx, self.n_loiters_done, self.state)
+        if self._full_redraw or key != self._frame_key:
+            rects = None
+            self._full_redraw = False
+            self._frame_key = key
+        else:
+            # Last frame's regions too, so whatever moved out of them is erased
+            rects = self._dirty + self._prev_dirty
+        self._prev_dirty = self._dirty
+        self._dirty = []
+        return rects
+
+    def _present(self, rects: Optional[List[pygame.Rect]]):
+        """Push a drawn frame to the display"""
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def _sim_loop(self, stop: threading.Event):
+        """Advance the simulation on wall-clock time until stop is set"""
+        last = time.monotonic()
+        while not stop.is_set():
+            now = time.monotonic()
+            with self._lock:
+                if not self.paused and self.state != 'DONE':
+                    self._update((now - last) * self.speed_mult)
+                    self._needs_redraw = True
+            last = now
+            time.sleep(FIXED_DT)
+
     def run(self):
+        # The simulation ticks on its own thread; this one handles input and
+        # rendering. Drawing holds the lock (the sim paints the coverage
+        # layer), while the display upload and frame pacing overlap the sim
+        stop = threading.Event()
+        sim = threading.Thread(target=self._sim_loop, args=(stop,), daemon=True)
+        sim.start()
+
         running = True
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                if event.type == pygame.VIDEOEXPOSE:
+                    with self._lock:
+                        self._full_redraw = self._needs_redraw = True
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
-                    elif event.key == pygame.K_SPACE:
-                        self.paused = not self.paused
-                    elif event.key in (pygame.K_PLUS, pygame.K_EQUALS):
-                        self.speed_mult = min(10, self.speed_mult + 0.5)
-                    elif event.key == pygame.K_MINUS:
-                        self.speed_mult = max(0.5, self.speed_mult - 0.5)
-                    elif event.key == pygame.K_r:
-                        self._reset_drone()
-
-            dt = self.clock.tick(60) / 1000.0
-
-            if not self.paused and self.state != 'DONE':
-                self._update(dt * self.speed_mult)
-
-            # Draw everything
-            self.screen.fill(COLORS['bg'])
-            self.draw_map()
-            self.draw_path()
-            self.draw_loiters()
-            self.draw_home()
-            self.draw_drone()
-            self.draw_panel()
-            pygame.display.flip()
+                        continue
+                    with self._lock:
+                        self._needs_redraw = True
+                        if event.key == pygame.K_SPACE:
+                            self.paused = not self.paused
+                        elif event.key in (pygame.K_PLUS, pygame.K_EQUALS):
+                            self.speed_mult = min(10, self.speed_mult + 0.5)
+                        elif event.key == pygame.K_MINUS:
+                            self.speed_mult = max(0.5, self.speed_mult - 0.5)
+                        elif event.key == pygame.K_r:
+                            self._reset_drone()
+
+            self.clock.tick(60)
+
+            with self._lock:
+                if not self._needs_redraw:
+                    continue
+                self._needs_redraw = False
+                self.draw_frame()
+                rects = self._take_dirty()
+            self._present(rects)
 
+        stop.set()
+        sim.join()
         pygame.quit()
 
 
@@ -0,0 +1,42 @@
+"""
+DroneSwarm must fly the same missions as independent SimpleDrones
+"""
+
+import numpy as np
+
+from src.core.geometry import Point
+from src.simulation.drone import DroneState, DroneSwarm, SimpleDrone
+
+
+MISSIONS = [
+    ([Point(50, 50), Point(400, 300), Point(700, 100), Point(900, 800),
+      Point(200, 600), Point(50, 50)], [1, 3]),
+    ([Point(500, 500), Point(100, 900), Point(800, 850), Point(500, 500)], [2]),
+    ([Point(900, 100), Point(300, 200), Point(900, 100)], []),
+]
+
+
+def test_swarm_matches_simple_drones():
+    drones = [SimpleDrone(position=path[0]) for path, _ in MISSIONS]
+    swarm = DroneSwarm([(path[0].x, path[0].y) for path, _ in MISSIONS])
+    for drone, (path, loiters) in zip(drones, MISSIONS):
+        drone.set_mission(path, loiters)
+    swarm.set_missions([path for path, _ in MISSIONS],
+                       [loiters for _, loiters in MISSIONS])
+
+    dt = 0.05
+    for _ in range(20000):
+        reached = swarm.update(dt)
+        for i, drone in enumerate(drones):
+            assert drone.update(dt) == reached[i]
+            assert drone.state == swarm.drone_state(i)
+            assert drone.current_waypoint_idx == swarm.waypoint_idx[i]
+        positions = np.array([(d.position.x, d.position.y) for d in drones])
+        np.testing.assert_allclose(swarm.positions, positions, atol=1e-6)
+        if not swarm.active.any():
+            break
+
+    assert all(d.state == DroneState.LANDED for d in drones)
+    np.testing.assert_allclose(swarm.battery, [d.battery for d in drones])
+    np.testing.assert_allclose(swarm.distance_traveled,
+                               [d.distance_traveled for d in drones])
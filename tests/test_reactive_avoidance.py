@@ -0,0 +1,23 @@
+"""
+ReactiveAvoidance must keep steering at the target all the way in
+"""
+
+import math
+
+from src.core.geometry import Point
+from src.core.map import SurveillanceMap
+from src.planners.reactive import ObstacleDetector, ReactiveAvoidance
+
+
+def test_heading_tracks_target_at_close_range():
+    smap = SurveillanceMap(width=1000, height=1000)
+    avoidance = ReactiveAvoidance(detector=ObstacleDetector(smap))
+    target = Point(500, 500)
+
+    # Sweep past the target at 0.2 m steps, 1 m off the line
+    for i in range(-50, 51):
+        position = Point(500 + 0.2 * i, 499)
+        heading, avoiding = avoidance.get_adjusted_heading(position, 0.0, target)
+        assert not avoiding
+        expected = math.atan2(target.y - position.y, target.x - position.x)
+        assert math.isclose(heading, expected, abs_tol=1e-12)